@@ -14,4 +14,7 @@ class IncompleteTraversalError(Exception):
     pass
 
 class InvalidMSTNodeError(Exception):
+    pass
+
+class NegativeCycleError(Exception):
     pass
\ No newline at end of file
@@ -2,9 +2,107 @@
 
 from Graph_Algorithms.algorithm_exceptions import *
 from Graph_Types.graph_exceptions import *
-from Graph_Util.conversions import Conversions
 from sys import maxsize
-from math import inf
+import numpy as np
+from operator import attrgetter, itemgetter
+
+
+def _articulation_points_csr(indptr, indices):
+    vertex_count = len(indptr) - 1
+    seen = [-1] * vertex_count
+    low = [-1] * vertex_count
+    parent = [-1] * vertex_count
+    children = [0] * vertex_count
+    next_edge = indptr[:-1]
+    points = [False] * vertex_count
+    iterations = 0
+
+    for root in range(vertex_count):
+        if seen[root] != -1:
+            continue
+
+        seen[root] = low[root] = iterations
+        iterations += 1
+        stack = [root]
+
+        while stack:
+            vertex = stack[-1]
+            edge = next_edge[vertex]
+
+            if edge < indptr[vertex + 1]:
+                neighbor = indices[edge]
+                next_edge[vertex] = edge + 1
+
+                if seen[neighbor] == -1:
+                    parent[neighbor] = vertex
+                    children[vertex] += 1
+                    seen[neighbor] = low[neighbor] = iterations
+                    iterations += 1
+                    stack.append(neighbor)
+                elif neighbor != parent[vertex]:
+                    low[vertex] = min(low[vertex], seen[neighbor])
+            else:
+                stack.pop()
+                vertex_parent = parent[vertex]
+
+                if vertex_parent == -1:
+                    if children[vertex] > 1:
+                        points[vertex] = True
+                    continue
+
+                low[vertex_parent] = min(low[vertex], low[vertex_parent])
+
+                if parent[vertex_parent] != -1 and low[vertex] >= seen[vertex_parent]:
+                    points[vertex_parent] = True
+
+    return points
+
+
+def _bridges_csr(indptr, indices):
+    vertex_count = len(indptr) - 1
+    seen = [-1] * vertex_count
+    low = [-1] * vertex_count
+    parent = [-1] * vertex_count
+    next_edge = indptr[:-1]
+    bridges = []
+    iterations = 0
+
+    for root in range(vertex_count):
+        if seen[root] != -1:
+            continue
+
+        seen[root] = low[root] = iterations
+        iterations += 1
+        stack = [root]
+
+        while stack:
+            vertex = stack[-1]
+            edge = next_edge[vertex]
+
+            if edge < indptr[vertex + 1]:
+                neighbor = indices[edge]
+                next_edge[vertex] = edge + 1
+
+                if seen[neighbor] == -1:
+                    parent[neighbor] = vertex
+                    seen[neighbor] = low[neighbor] = iterations
+                    iterations += 1
+                    stack.append(neighbor)
+                elif neighbor != parent[vertex]:
+                    low[vertex] = min(low[vertex], seen[neighbor])
+            else:
+                stack.pop()
+                vertex_parent = parent[vertex]
+
+                if vertex_parent == -1:
+                    continue
+
+                low[vertex_parent] = min(low[vertex], low[vertex_parent])
+
+                if low[vertex] > seen[vertex_parent]:
+                    bridges.append((vertex_parent, vertex))
+
+    return bridges
 
 
 class Cuts:
@@ -15,142 +113,87 @@ class Cuts:
         if self._type not in ["UnweightedGraph", "WeightedGraph", "AdjacencyList", "AdjacencyMatrix"]:
             raise UnsupportedGraphTypeError(f"Invalid graph type: {self._type}")
 
-        self._iterations = 0
+        self._find_neighbors = {'UnweightedGraph': self._neighbors_unweighted,
+                                'WeightedGraph': self._neighbors_weighted,
+                                'AdjacencyList': self._neighbors_adjlist,
+                                'AdjacencyMatrix': self._neighbors_adjmat}[self._type]
+        self._is_graph_type = self._type in ("UnweightedGraph", "WeightedGraph")
+        self._value_of = attrgetter('value') if self._is_graph_type else (lambda v: v)
+        self._reset_neighbors_cache()
+
+    # neighbors and the csr arrays are cached on first use, so the graph is assumed not to change during a
+    # search. Every public search starts from an empty cache, so changes between calls are picked up
+    def _reset_neighbors_cache(self):
+        self._neighbors_cache = {}
+        self._csr = None
+        self._idx_to_vertex = {}
+        if self._type == 'AdjacencyMatrix':
+            self._idx_to_vertex = {index: vertex for vertex, index in self._graph.vertices.items()}
 
     def _get_neighbors(self, node):
-        if self._type == 'UnweightedGraph':
-            return node.get_neighbors()
-        elif self._type == 'WeightedGraph':
-            return [neighbor[0] for neighbor in sorted(node.get_neighbors(), key=lambda neighbor: neighbor[1])]
-        elif self._type == 'AdjacencyList':
-            return [neighbor[0] for neighbor in sorted([[neighbor[0], -maxsize if neighbor[1] is None else
-            neighbor[1]] for neighbor in self._graph.adjacency_list[node]], key=lambda neighbor: (neighbor[1],
-                                                                                                  neighbor[0]))]
-        elif self._type == 'AdjacencyMatrix':
-            neighbors = []
-            for i in range(len(self._graph.adjacency_matrix[self._graph.vertices[node]])):
-                if self._graph.adjacency_matrix[self._graph.vertices[node]][i] != 0:
-                    vertex2 = list(self._graph.vertices.keys())[list(self._graph.vertices.values()).index(i)]
-                    tgt_weight = self._graph.adjacency_matrix[self._graph.vertices[node], self._graph.vertices[vertex2]]
-                    if tgt_weight == 1:
-                        tgt_weight = None
-                    else:
-                        tgt_weight = tgt_weight - 2 if tgt_weight > 0 else tgt_weight
-                    neighbors.append([vertex2, tgt_weight])
-
-            return [neighbor[0] for neighbor in sorted([[neighbor[0], -maxsize if neighbor[1] is None else
-            neighbor[1]] for neighbor in neighbors], key=lambda neighbor: (neighbor[1], neighbor[0]))]
+        if node not in self._neighbors_cache:
+            self._neighbors_cache[node] = tuple(self._find_neighbors(node))
 
-    def _articulation_recurse(self, vertex, visited, points, parent, low, seen):
-        children = 0
-        vertex_value = vertex.value if 'Graph' in self._type else vertex
+        return self._neighbors_cache[node]
 
-        visited.append(vertex_value)
+    def _neighbors_unweighted(self, node):
+        return node.get_neighbors()
 
-        seen[vertex_value] = self._iterations
-        low[vertex_value] = self._iterations
-        self._iterations += 1
+    def _neighbors_weighted(self, node):
+        return [neighbor[0] for neighbor in sorted(node.get_neighbors(), key=itemgetter(1))]
 
-        neighbors = self._get_neighbors(vertex)
+    def _neighbors_adjlist(self, node):
+        return [neighbor[1] for neighbor in sorted((-maxsize if weight is None else weight, neighbor)
+                                                   for neighbor, weights in self._graph.adjacency_list[node].items()
+                                                   for weight in weights)]
 
-        for neighbor in neighbors:
-            if neighbor not in visited:
-                parent[neighbor] = vertex_value
-                children += 1
-                if 'Graph' in self._type:
-                    neighbor = self._graph.get_vertex(neighbor)
+    def _neighbors_adjmat(self, node):
+        row = self._graph.adjacency_matrix[self._graph.vertices[node]]
+        targets = np.flatnonzero(row)
+        weights = row[targets]
+        weights = np.where(weights == 1, -maxsize, np.where(weights > 0, weights - 2, weights))
 
-                self._articulation_recurse(neighbor, visited, points, parent, low, seen)
-                if 'Graph' in self._type:
-                    neighbor = neighbor.value
+        return [neighbor[1] for neighbor in sorted(zip(weights.tolist(), [self._idx_to_vertex[i] for i in
+                                                                          targets.tolist()]))]
 
-                low[vertex_value] = min(low[neighbor], low[vertex_value])
+    def _to_csr(self):
+        if self._csr is None:
+            vertex_values = []
+            neighbors = []
+            for vertex in self._graph.vertices.values() if self._is_graph_type else self._graph.vertices:
+                vertex_values.append(self._value_of(vertex))
+                neighbors.append(self._get_neighbors(vertex))
 
-                if vertex_value not in parent and children > 1:
-                    points.append(vertex_value)
+            vertex_ids = dict(zip(vertex_values, range(len(vertex_values))))
+            indptr = np.zeros(len(vertex_values) + 1, dtype=np.int32)
+            indptr[1:] = np.cumsum([len(vertex_neighbors) for vertex_neighbors in neighbors])
+            indices = np.fromiter((vertex_ids[neighbor] for vertex_neighbors in neighbors
+                                   for neighbor in vertex_neighbors), dtype=np.int32, count=indptr[-1])
 
-                if vertex_value in parent and low[neighbor] >= seen[vertex_value]:
-                    points.append(vertex_value)
+            self._csr = (indptr, indices, vertex_values)
 
-            elif neighbor != parent[vertex_value]:
-                low[vertex_value] = min(low[vertex_value], seen[neighbor])
+        return self._csr
 
     def articulation_points(self):
         if self._graph.directed:
-            self._graph = Conversions.directed_to_undirected(self._graph)
-        
-        visited = []
-        seen = dict()
-        low = dict()
-        parent = dict()
-
-        for vertex in self._graph.vertices:
-            vertex_value = vertex.value if 'Graph' in self._type else vertex
-            seen[vertex_value] = inf
-            low[vertex_value] = inf
-            parent[vertex_value] = -1
-
-        points = []
-
-        for vertex in self._graph.vertices:
-            if ('Graph' in self._type and vertex.value not in visited) or vertex not in visited:
-                self._articulation_recurse(vertex, visited, points, parent, low, seen)
-
-        return sorted(list(set(points)))
-
-    def _bridges_recurse(self, vertex, visited, bridges, parent, low, seen):
-        children = 0
-        vertex_value = vertex.value if 'Graph' in self._type else vertex
-
-        visited.append(vertex_value)
+            from Graph_Util.conversions import Conversions
 
-        seen[vertex_value] = self._iterations
-        low[vertex_value] = self._iterations
-        self._iterations += 1
-
-        neighbors = self._get_neighbors(vertex)
-
-        for neighbor in neighbors:
-            if neighbor not in visited:
-                parent[neighbor] = vertex_value
-                children += 1
-                if 'Graph' in self._type:
-                    neighbor = self._graph.get_vertex(neighbor)
-
-                self._bridges_recurse(neighbor, visited, bridges, parent, low, seen)
-                if 'Graph' in self._type:
-                    neighbor = neighbor.value
-
-                low[vertex_value] = min(low[neighbor], low[vertex_value])
+            self._graph = Conversions.directed_to_undirected(self._graph)
 
-                if low[neighbor] > seen[vertex_value]:
-                    bridges.append([vertex_value, neighbor])
+        self._reset_neighbors_cache()
+        indptr, indices, vertex_values = self._to_csr()
+        points = _articulation_points_csr(indptr.tolist(), indices.tolist())
 
-            elif neighbor != parent[vertex_value]:
-                low[vertex_value] = min(low[vertex_value], seen[neighbor])
+        return sorted(vertex_values[i] for i, is_point in enumerate(points) if is_point)
 
     def bridges(self):
         if self._graph.directed:
-            self._graph = Conversions.directed_to_undirected(self._graph)
+            from Graph_Util.conversions import Conversions
 
-        if self._graph.directed:
             self._graph = Conversions.directed_to_undirected(self._graph)
 
-        visited = []
-        seen = dict()
-        low = dict()
-        parent = dict()
-
-        for vertex in self._graph.vertices:
-            vertex_value = vertex.value if 'Graph' in self._type else vertex
-            seen[vertex_value] = inf
-            low[vertex_value] = inf
-            parent[vertex_value] = -1
-
-        bridges = []
-
-        for vertex in self._graph.vertices:
-            if ('Graph' in self._type and vertex.value not in visited) or vertex not in visited:
-                self._bridges_recurse(vertex, visited, bridges, parent, low, seen)
+        self._reset_neighbors_cache()
+        indptr, indices, vertex_values = self._to_csr()
 
-        return bridges
\ No newline at end of file
+        return [[vertex_values[vertex1], vertex_values[vertex2]] for vertex1, vertex2 in
+                _bridges_csr(indptr.tolist(), indices.tolist())]
@@ -1,9 +1,10 @@
 
 
 from Graph_Algorithms.algorithm_exceptions import *
-from Graph_Algorithms.shortest_paths import ShortestPaths
 from collections import Counter
 from sys import maxsize
+import numpy as np
+from operator import attrgetter
 
 
 class Cycles:
@@ -14,213 +15,310 @@ class Cycles:
         if self._type not in ["UnweightedGraph", "WeightedGraph", "AdjacencyList", "AdjacencyMatrix"]:
             raise UnsupportedGraphTypeError(f"Invalid graph type: {self._type}")
 
+        self._find_neighbors = {'UnweightedGraph': self._neighbors_unweighted,
+                                'WeightedGraph': self._neighbors_weighted,
+                                'AdjacencyList': self._neighbors_adjlist,
+                                'AdjacencyMatrix': self._neighbors_adjmat}[self._type]
+        self._is_graph_type = self._type in ("UnweightedGraph", "WeightedGraph")
+        self._reset_neighbors_cache()
+
+    # neighbors and the sorted vertex order are cached on first use, so the graph is assumed not to change
+    # during a search. Every public search starts from an empty cache, so changes between calls are picked up
+    def _reset_neighbors_cache(self):
+        self._neighbors_cache = {}
+        self._neighbor_sets = {}
+        self._sorted_vertices = None
+        self._idx_to_vertex = {}
+        if self._type == 'AdjacencyMatrix':
+            self._idx_to_vertex = {index: vertex for vertex, index in self._graph.vertices.items()}
+
     def _get_neighbors(self, node):
-        if self._type == 'UnweightedGraph':
-            return node.get_neighbors()
-        elif self._type == 'WeightedGraph':
-            return sorted([neighbor[0] for neighbor in node.get_neighbors()])
-        elif self._type == 'AdjacencyList':
-            return [neighbor[0] for neighbor in sorted([[neighbor[0], -maxsize if neighbor[1] is None else
-            neighbor[1]] for neighbor in self._graph.adjacency_list[node]], key=lambda neighbor: (neighbor[1],
-                                                                                                  neighbor[0]))]
-        elif self._type == 'AdjacencyMatrix':
-            neighbors = []
-            for i in range(len(self._graph.adjacency_matrix[self._graph.vertices[node]])):
-                if self._graph.adjacency_matrix[self._graph.vertices[node]][i] != 0:
-                    vertex2 = list(self._graph.vertices.keys())[list(self._graph.vertices.values()).index(i)]
-                    tgt_weight = self._graph.adjacency_matrix[self._graph.vertices[node], self._graph.vertices[vertex2]]
-                    if tgt_weight == 1:
-                        tgt_weight = None
-                    else:
-                        tgt_weight = tgt_weight - 2 if tgt_weight > 0 else tgt_weight
-                    neighbors.append([vertex2, tgt_weight])
-
-            return [neighbor[0] for neighbor in sorted([[neighbor[0], -maxsize if neighbor[1] is None else
-            neighbor[1]] for neighbor in neighbors], key=lambda neighbor: (neighbor[1], neighbor[0]))]
-
-    def _undirected_graph_cycle_recurse(self, node, visited, parent=None):
-        visited.append(node.value)
-        neighbors = self._get_neighbors(node)
+        if node not in self._neighbors_cache:
+            self._neighbors_cache[node] = tuple(self._find_neighbors(node))
 
-        for neighbor in neighbors:
-            if neighbor not in visited:
-                neighbor = self._graph.get_vertex(neighbor)
-                if self._undirected_graph_cycle_recurse(neighbor, visited, node):
-                    return True
-                if neighbor in visited:
-                    visited.remove(neighbor)
-            elif parent and parent.value != neighbor:
-                visited.append(neighbor)
-                return True
-            elif self._graph.multiple_edges:
-                if (isinstance(node.neighbors[neighbor], list) and len(node.neighbors[neighbor]) > 1) or \
-                        (isinstance(node.neighbors[neighbor], int) and node.neighbors[neighbor] > 1) or \
-                        node.value == neighbor:
-                    visited.append(neighbor)
-                    return True
+        return self._neighbors_cache[node]
 
-        return False
+    def _get_sorted_vertices(self):
+        if self._sorted_vertices is None:
+            if self._is_graph_type:
+                self._sorted_vertices = sorted(self._graph.vertices.values(), key=attrgetter('value'))
+            else:
+                self._sorted_vertices = sorted(self._graph.vertices)
 
-    def _directed_graph_cycle_recurse(self, node, visited, recursion_stack):
-        visited.append(node.value)
-        recursion_stack.append(node.value)
-        neighbors = self._get_neighbors(node)
+        return self._sorted_vertices
 
-        for neighbor in neighbors:
-            if neighbor not in visited:
-                neighbor = self._graph.get_vertex(neighbor)
-                if self._directed_graph_cycle_recurse(neighbor, visited, recursion_stack):
-                    return True
-                if neighbor in visited:
-                    visited.remove(neighbor)
-            elif neighbor in recursion_stack:
-                visited.append(neighbor)
-                return True
+    def _neighbors_unweighted(self, node):
+        return node.get_neighbors()
 
-        recursion_stack.remove(node.value)
-        return False
+    def _neighbors_weighted(self, node):
+        return sorted([neighbor[0] for neighbor in node.get_neighbors()])
+
+    def _neighbors_adjlist(self, node):
+        return [neighbor[1] for neighbor in sorted((-maxsize if weight is None else weight, neighbor)
+                                                   for neighbor, weights in self._graph.adjacency_list[node].items()
+                                                   for weight in weights)]
+
+    def _neighbors_adjmat(self, node):
+        row = self._graph.adjacency_matrix[self._graph.vertices[node]]
+        targets = np.flatnonzero(row)
+        weights = row[targets]
+        weights = np.where(weights == 1, -maxsize, np.where(weights > 0, weights - 2, weights))
+
+        return [neighbor[1] for neighbor in sorted(zip(weights.tolist(), [self._idx_to_vertex[i] for i in
+                                                                          targets.tolist()]))]
+
+    def _undirected_graph_cycle_search(self, node, visited, visited_index):
+        visited_index[node.value] = len(visited)
+        visited.append(node.value)
+        # each frame is (node, remaining neighbors, parent node)
+        stack = [(node, iter(self._get_neighbors(node)), None)]
+
+        while stack:
+            node, neighbors, parent = stack[-1]
+
+            for neighbor in neighbors:
+                if neighbor not in visited_index:
+                    neighbor = self._graph.get_vertex(neighbor)
+                    visited_index[neighbor.value] = len(visited)
+                    visited.append(neighbor.value)
+                    stack.append((neighbor, iter(self._get_neighbors(neighbor)), node))
+                    break
+                elif parent and parent.value != neighbor:
+                    visited.append(neighbor)
+                    return visited_index[neighbor]
+                elif self._graph.multiple_edges:
+                    if (isinstance(node.neighbors[neighbor], list) and len(node.neighbors[neighbor]) > 1) or \
+                            (isinstance(node.neighbors[neighbor], int) and node.neighbors[neighbor] > 1) or \
+                            node.value == neighbor:
+                        visited.append(neighbor)
+                        return visited_index[neighbor]
+            else:
+                stack.pop()
+
+        return None
+
+    def _directed_graph_cycle_search(self, node, visited, visited_index, recursion_stack):
+        visited_index[node.value] = len(visited)
+        visited.append(node.value)
+        recursion_stack.add(node.value)
+        stack = [(node, iter(self._get_neighbors(node)))]
+
+        while stack:
+            node, neighbors = stack[-1]
+
+            for neighbor in neighbors:
+                if neighbor not in visited_index:
+                    neighbor = self._graph.get_vertex(neighbor)
+                    visited_index[neighbor.value] = len(visited)
+                    visited.append(neighbor.value)
+                    recursion_stack.add(neighbor.value)
+                    stack.append((neighbor, iter(self._get_neighbors(neighbor))))
+                    break
+                elif neighbor in recursion_stack:
+                    visited.append(neighbor)
+                    return visited_index[neighbor]
+            else:
+                stack.pop()
+                recursion_stack.discard(node.value)
+
+        return None
 
     def _graph_cycle(self):
         visited = []
-        recursion_stack = []
+        visited_index = {}
+        recursion_stack = set()
 
-        for node in sorted(self._graph.vertices, key=lambda x: x.value):
-            if node.value not in visited:
+        for node in self._get_sorted_vertices():
+            if node.value not in visited_index:
                 if not self._graph.directed:
-                    if self._undirected_graph_cycle_recurse(node, visited):
-                        visited = visited[visited.index(visited[-1]):]
-                        return [True, visited]
+                    start = self._undirected_graph_cycle_search(node, visited, visited_index)
+                    if start is not None:
+                        return [True, visited[start:]]
                 else:
-                    if self._directed_graph_cycle_recurse(node, visited, recursion_stack):
-                        visited = visited[visited.index(visited[-1]):]
-                        return [True, visited]
+                    start = self._directed_graph_cycle_search(node, visited, visited_index, recursion_stack)
+                    if start is not None:
+                        return [True, visited[start:]]
 
         return [False, [None]]
 
-    def _undirected_adjacency_cycle_recurse(self, node, visited, parent=None):
+    def _undirected_adjacency_cycle_search(self, node, visited, visited_index):
+        visited_index[node] = len(visited)
         visited.append(node)
-        neighbors = self._get_neighbors(node)
-
-        for neighbor in neighbors:
-            if neighbor not in visited:
-                if self._undirected_adjacency_cycle_recurse(neighbor, visited, node):
-                    return True
-                if neighbor in visited:
-                    visited.remove(neighbor)
-            elif parent and parent != neighbor:
-                visited.append(neighbor)
-                return True
-            elif self._graph.multiple_edges:
-                temp_node = self._graph.get_vertex(node)
-                temp_node[1] = [temp[0] for temp in temp_node[1]]
-                if Counter(temp_node[1])[neighbor] > 1 or \
-                        node == neighbor:
-                    visited.append(neighbor)
-                    return True
+        # each frame is (vertex, remaining neighbors, parent vertex)
+        stack = [(node, iter(self._get_neighbors(node)), None)]
 
-        return False
+        while stack:
+            node, neighbors, parent = stack[-1]
 
-    def _directed_adjacency_cycle_recurse(self, node, visited, recursion_stack):
+            for neighbor in neighbors:
+                if neighbor not in visited_index:
+                    visited_index[neighbor] = len(visited)
+                    visited.append(neighbor)
+                    stack.append((neighbor, iter(self._get_neighbors(neighbor)), node))
+                    break
+                elif parent and parent != neighbor:
+                    visited.append(neighbor)
+                    return visited_index[neighbor]
+                elif self._graph.multiple_edges:
+                    temp_node = self._graph.get_vertex(node)
+                    temp_node[1] = [temp[0] for temp in temp_node[1]]
+                    if Counter(temp_node[1])[neighbor] > 1 or \
+                            node == neighbor:
+                        visited.append(neighbor)
+                        return visited_index[neighbor]
+            else:
+                stack.pop()
+                # a fully explored vertex is always the tail of the current path
+                if stack and node in visited_index:
+                    visited.pop()
+                    del visited_index[node]
+
+        return None
+
+    def _directed_adjacency_cycle_search(self, node, visited, visited_index, recursion_stack):
+        visited_index[node] = len(visited)
         visited.append(node)
-        recursion_stack.append(node)
-        neighbors = self._get_neighbors(node)
+        recursion_stack.add(node)
+        stack = [(node, iter(self._get_neighbors(node)))]
 
-        for neighbor in neighbors:
-            if neighbor not in visited:
-                if self._directed_adjacency_cycle_recurse(neighbor, visited, recursion_stack):
-                    return True
-                if neighbor in visited:
-                    visited.remove(neighbor)
-            elif neighbor in recursion_stack:
-                visited.append(neighbor)
-                return True
+        while stack:
+            node, neighbors = stack[-1]
 
-        recursion_stack.remove(node)
-        return False
+            for neighbor in neighbors:
+                if neighbor not in visited_index:
+                    visited_index[neighbor] = len(visited)
+                    visited.append(neighbor)
+                    recursion_stack.add(neighbor)
+                    stack.append((neighbor, iter(self._get_neighbors(neighbor))))
+                    break
+                elif neighbor in recursion_stack:
+                    visited.append(neighbor)
+                    return visited_index[neighbor]
+            else:
+                stack.pop()
+                recursion_stack.discard(node)
+                if stack and node in visited_index:
+                    visited.pop()
+                    del visited_index[node]
+
+        return None
 
     def _adjacency_cycle(self):
         visited = []
-        recursion_stack = []
+        visited_index = {}
+        recursion_stack = set()
 
-        for node in sorted(self._graph.vertices):
-            if node not in visited:
+        for node in self._get_sorted_vertices():
+            if node not in visited_index:
                 if not self._graph.directed:
-                    if self._undirected_adjacency_cycle_recurse(node, visited):
-                        visited = visited[visited.index(visited[-1]):]
-                        return [True, visited]
+                    start = self._undirected_adjacency_cycle_search(node, visited, visited_index)
+                    if start is not None:
+                        return [True, visited[start:]]
                 else:
-                    if self._directed_adjacency_cycle_recurse(node, visited, recursion_stack):
-                        visited = visited[visited.index(visited[-1]):]
-                        return [True, visited]
+                    start = self._directed_adjacency_cycle_search(node, visited, visited_index, recursion_stack)
+                    if start is not None:
+                        return [True, visited[start:]]
 
         return [False, None]
 
     def detect_cycle(self):
-        if 'Graph' in self._type:
+        self._reset_neighbors_cache()
+        if self._is_graph_type:
             return self._graph_cycle()
         else:
             return self._adjacency_cycle()
 
+    def _get_weighted_edges(self):
+        edges = []
+
+        for vertex in self._graph.vertices.values() if self._is_graph_type else self._graph.vertices:
+            if self._type == 'UnweightedGraph':
+                edges.extend((vertex.value, neighbor, 1) for neighbor in vertex.get_neighbors())
+            elif self._type == 'WeightedGraph':
+                edges.extend((vertex.value, neighbor, weight) for neighbor, weight in vertex.get_neighbors())
+            elif self._type == 'AdjacencyList':
+                edges.extend((vertex, neighbor, 1 if weight is None else weight)
+                             for neighbor, weights in self._graph.adjacency_list[vertex].items() for weight in weights)
+            elif self._type == 'AdjacencyMatrix':
+                row = self._graph.adjacency_matrix[self._graph.vertices[vertex]]
+                targets = np.flatnonzero(row)
+                weights = row[targets]
+                weights = np.where(weights > 1, weights - 2, weights)
+                edges.extend((vertex, self._idx_to_vertex[i], weight) for i, weight in
+                             zip(targets.tolist(), weights.tolist()))
+
+        return edges
+
     def detect_negative_cycle(self):
-        shortest_path = ShortestPaths(self._graph)
-        distances = shortest_path.floyd_warshall()
-        negative_cycle = False
+        self._reset_neighbors_cache()
+        edges = self._get_weighted_edges()
+        # every vertex starts at 0, as if reached from a virtual source by a zero-weight edge
+        distances = {vertex1: 0 for vertex1, vertex2, weight in edges}
+        relaxed = False
 
-        for vertex in distances:
-            for path in distances[vertex]:
-                if vertex == path[0] and path[1] < 0:
-                    negative_cycle = True
+        for i in range(len(self._graph.vertices)):
+            relaxed = False
+            for vertex1, vertex2, weight in edges:
+                if distances[vertex1] + weight < distances.get(vertex2, 0):
+                    distances[vertex2] = distances[vertex1] + weight
+                    relaxed = True
 
-        return negative_cycle
+            if not relaxed:
+                break
 
-    def _verify_path(self, path, vertex):
-        for path_vertex in path:
-            if path_vertex == vertex:
-                return False
+        return relaxed
 
-        return True
+    def _neighbor_set(self, vertex):
+        if vertex not in self._neighbor_sets:
+            node = self._graph.get_vertex(vertex) if self._is_graph_type else vertex
+            self._neighbor_sets[vertex] = set(self._get_neighbors(node))
 
-    def _graph_adjacent_vertex_not_in_path(self, vertex, curr_index, path):
-        return self._graph.get_vertex(path[curr_index - 1]).is_neighbor(vertex) and self._verify_path(path, vertex)
+        return self._neighbor_sets[vertex]
 
-    def _graph_hamiltonian_cycle_recurse(self, path, curr_index):
+    def _graph_adjacent_vertex_not_in_path(self, vertex, curr_index, path, path_set):
+        return vertex in self._neighbor_set(path[curr_index - 1]) and vertex not in path_set
+
+    def _graph_hamiltonian_cycle_recurse(self, path, path_set, curr_index):
         if curr_index == len(self._graph.vertices):
-            return self._graph.get_vertex(path[curr_index - 1]).is_neighbor(path[0])
+            return path[0] in self._neighbor_set(path[curr_index - 1])
 
         for vertex in self._graph.vertices:
-            if self._graph_adjacent_vertex_not_in_path(vertex.value, curr_index, path):
-                path.append(vertex.value)
+            if self._graph_adjacent_vertex_not_in_path(vertex, curr_index, path, path_set):
+                path.append(vertex)
+                path_set.add(vertex)
 
-                if self._graph_hamiltonian_cycle_recurse(path, curr_index + 1):
+                if self._graph_hamiltonian_cycle_recurse(path, path_set, curr_index + 1):
                     return True
 
-                path.remove(vertex.value)
+                path.pop()
+                path_set.discard(vertex)
 
         return False
 
-    def _adjacency_adjacent_vertex_not_in_path(self, vertex, curr_index, path):
-        return vertex not in [neighbor[0] for neighbor in self._graph.get_vertex(path[curr_index - 1])[1]] and \
-               self._verify_path(path, vertex)
+    def _adjacency_adjacent_vertex_not_in_path(self, vertex, curr_index, path, path_set):
+        return vertex not in self._neighbor_set(path[curr_index - 1]) and vertex not in path_set
 
-    def _adjacency_hamiltonian_cycle_recurse(self, path, curr_index):
+    def _adjacency_hamiltonian_cycle_recurse(self, path, path_set, curr_index):
         if curr_index == len(self._graph.vertices):
-            return path[0] in [neighbor[0] for neighbor in self._graph.get_vertex(path[curr_index - 1])[1]]
+            return path[0] in self._neighbor_set(path[curr_index - 1])
 
         for vertex in self._graph.vertices:
-            if self._adjacency_adjacent_vertex_not_in_path(vertex, curr_index, path):
+            if self._adjacency_adjacent_vertex_not_in_path(vertex, curr_index, path, path_set):
                 path.append(vertex)
+                path_set.add(vertex)
 
-                if self._adjacency_hamiltonian_cycle_recurse(path, curr_index + 1):
+                if self._adjacency_hamiltonian_cycle_recurse(path, path_set, curr_index + 1):
                     return True
 
-                path.remove(vertex)
+                path.pop()
+                path_set.discard(vertex)
 
         return False
 
     def _graph_hamiltonian_cycle(self, start_node=None):
         path = [start_node.value]
 
-        if not self._graph_hamiltonian_cycle_recurse(path, 1):
+        if not self._graph_hamiltonian_cycle_recurse(path, {start_node.value}, 1):
             return [False, None]
 
         path.append(path[0])
@@ -229,16 +327,17 @@ class Cycles:
     def _adjacency_hamiltonian_cycle(self, start_node=None):
         path = [start_node]
 
-        if not self._adjacency_hamiltonian_cycle_recurse(path, 1):
+        if not self._adjacency_hamiltonian_cycle_recurse(path, {start_node}, 1):
             return [False, None]
 
         path.append(path[0])
         return [True, path]
 
     def hamiltonian_cycle(self, start_node=None):
+        self._reset_neighbors_cache()
         start_node = self._graph.get_vertex(start_node) if start_node is not None else self._graph.get_start_vertex()
 
-        if 'Graph' in self._type:
+        if self._is_graph_type:
             return self._graph_hamiltonian_cycle(start_node)
         else:
             return self._adjacency_hamiltonian_cycle(start_node[0])
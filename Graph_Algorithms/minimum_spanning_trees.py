@@ -2,7 +2,8 @@
 
 from Graph_Algorithms.algorithm_exceptions import *
 from Graph_Types.graph_exceptions import *
-from sys import maxsize
+from heapq import heappush, heappop
+from operator import itemgetter
 
 
 class MSTs:
@@ -23,16 +24,18 @@ class MSTs:
         else:
             return self._graph.get_start_vertex().value if 'Graph' in self._type else self._graph.get_start_vertex()
 
-    def _min_weight_not_in_mst(self, weights, vertex_set):
-        min_weight = maxsize
-        min_vertex = None
+    def _weighted_neighbors(self, vertex):
+        if self._type == 'UnweightedGraph':
+            # multi-graph neighbors map to edge counts, every edge still weighs 1
+            return [(neighbor, 1) for neighbor in self._graph.get_vertex(vertex).neighbors]
+        elif self._type == 'WeightedGraph':
+            node = self._graph.get_vertex(vertex)
+            if node.multiple_edges:
+                return [(neighbor, min(weights)) for neighbor, weights in node.neighbors.items()]
+            return node.neighbors.items()
 
-        for vertex, weight in weights.items():
-            if weight < min_weight and vertex in vertex_set:
-                min_weight = weight
-                min_vertex = vertex
-
-        return min_vertex, min_weight
+        return [(neighbor[0], 1 if neighbor[1] is None else neighbor[1])
+                for neighbor in self._graph.get_vertex(vertex)[1]]
 
     def prims_mst(self, start_node=None):
         if self._graph.directed:
@@ -40,45 +43,24 @@ class MSTs:
                                             f"incompatible with directed graphs.")
 
         start_node = self.verify_root_node(start_node)
-        weights = {}
-        parent = {}
-        vertex_set = set()
+        in_mst = set()
+        heap = [(0, start_node, None)]
         mst = []
         min_cost = 0
 
-        for vertex in self._graph.vertices:
-            weights[vertex.value if not isinstance(vertex, int) else vertex] = maxsize
-            vertex_set.add(vertex.value if not isinstance(vertex, int) else vertex)
-            parent[vertex.value if not isinstance(vertex, int) else vertex] = None
-
-        weights[start_node] = 0
-
-        for i in self._graph.vertices:
-            min_vertex, min_weight = self._min_weight_not_in_mst(weights, vertex_set)
-            vertex_set.discard(min_vertex)
-
-            if parent[min_vertex] is not None:
-                mst.append([parent[min_vertex][0], min_vertex, parent[min_vertex][1]])
-
-            for vertex in self._graph.vertices:
-                if isinstance(vertex, int):
-                    temp_weight = [neighbor[1] for neighbor in self._graph.get_vertex(vertex)[1] if
-                                   neighbor[0] == min_vertex]
-                    if len(temp_weight) > 0 and vertex in vertex_set and weights[vertex] > temp_weight[0]:
-                        weights[vertex] = temp_weight[0]
-                        parent[vertex] = [min_vertex, temp_weight[0]]
-                else:
-                    if vertex.is_neighbor(min_vertex) and vertex.value in vertex_set:
-                        if isinstance(vertex.neighbors, set):
-                            if weights[vertex.value] > 1:
-                                weights[vertex.value] = 1
-                                parent[vertex.value] = min_vertex
-                        elif weights[vertex.value] > vertex.neighbors[min_vertex]:
-                            weights[vertex.value] = vertex.neighbors[min_vertex]
-                            parent[vertex.value] = [min_vertex, vertex.neighbors[min_vertex]]
-
-        for edge in mst:
-            min_cost += edge[2]
+        while heap:
+            weight, vertex, parent = heappop(heap)
+            if vertex in in_mst:
+                continue
+
+            in_mst.add(vertex)
+            if parent is not None:
+                mst.append([parent, vertex, weight])
+                min_cost += weight
+
+            for neighbor, neighbor_weight in self._weighted_neighbors(vertex):
+                if neighbor not in in_mst:
+                    heappush(heap, (neighbor_weight, neighbor, vertex))
 
         return [min_cost, mst]
 
@@ -86,33 +68,22 @@ class MSTs:
         edges = {}
 
         for vertex in self._graph.vertices:
-            if 'Graph' in self._type:
-                neighbors = vertex.get_neighbors()
-
-                for edge in neighbors:
-                    if isinstance(edge, int):
-                        if (vertex.value, edge) not in edges and (edge, vertex.value) not in edges:
-                            edges[(vertex.value, edge)] = 1
-                    elif (vertex.value, edge[0]) not in edges and (edge[0], vertex.value) not in edges:
-                        edges[(vertex.value, edge[0])] = edge[1]
-            else:
-                neighbors = self._graph.get_vertex(vertex)[1]
-
-                for edge in neighbors:
-                    if isinstance(edge, int):
-                        if (vertex, edge) not in edges and (edge, vertex) not in edges:
-                            edges[(vertex, edge)] = 1
-                    elif (vertex, edge[0]) not in edges and (edge[0], vertex) not in edges:
-                        edges[(vertex, edge[0])] = edge[1]
-
-        edges = sorted(edges.items(), key=lambda x: x[1])
-        edges = [[*edge[0], edge[1]] for edge in edges]
-        return edges
+            for neighbor, weight in self._weighted_neighbors(vertex):
+                key = (vertex, neighbor) if vertex < neighbor else (neighbor, vertex)
+                if key not in edges or weight < edges[key]:
+                    edges[key] = weight
+
+        return sorted(([*key, weight] for key, weight in edges.items()), key=itemgetter(2))
 
     def _find_set(self, nodes, target):
-        if nodes[target] == target:
-            return target
-        return self._find_set(nodes, nodes[target])
+        root = target
+        while nodes[root] != root:
+            root = nodes[root]
+
+        while nodes[target] != root:
+            nodes[target], target = root, nodes[target]
+
+        return root
 
     def _union(self, nodes, rank, first, second):
         root1 = self._find_set(nodes, first)
@@ -131,20 +102,17 @@ class MSTs:
             raise UnsupportedGraphTypeError(f"This {self._graph.name()} is a directed graph. Kruskal's MST is "
                                             f"incompatible with directed graphs.")
         edges = self._get_edges()
-        nodes = []
-        rank = [0] * len(self._graph.vertices)
+        vertex_values = list(self._graph.vertices)
+        nodes = dict(zip(vertex_values, vertex_values))
+        rank = dict.fromkeys(vertex_values, 0)
         mst = []
         min_cost = 0
 
-        for vertex in self._graph.vertices:
-            nodes.append(vertex.value if 'Graph' in self._type else vertex)
-
-        nodes.sort()
+        mst_size = len(self._graph.vertices) - 1
 
-        while len(mst) < len(self._graph.vertices) - 1:
-            if len(edges) == 0:
+        for edge in edges:
+            if len(mst) >= mst_size:
                 break
-            edge = edges.pop(0)
             first = self._find_set(nodes, edge[0])
             second = self._find_set(nodes, edge[1])
 
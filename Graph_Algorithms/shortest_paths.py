@@ -3,8 +3,8 @@
 from Graph_Algorithms.algorithm_exceptions import *
 from Graph_Util.conversions import Conversions
 from math import inf
-from sys import maxsize
-from copy import deepcopy
+from heapq import heappush, heappop
+import numpy as np
 
 
 class ShortestPaths:
@@ -15,77 +15,72 @@ class ShortestPaths:
         if self._type not in ["UnweightedGraph", "WeightedGraph", "AdjacencyList", "AdjacencyMatrix"]:
             raise UnsupportedGraphTypeError(f"Invalid graph type: {self._type}")
 
-    def _graph_min_distance(self, spt_set, distances):
-        next_vertex = None
-        min_dist = maxsize
+        self._idx_to_vertex = {}
+        if self._type == 'AdjacencyMatrix':
+            self._idx_to_vertex = {index: vertex for vertex, index in self._graph.vertices.items()}
 
-        for vertex in spt_set:
-            vertex_node = self._graph.get_vertex(vertex)
-            if vertex_node.disconnected():
-                continue
-
-            neighbors = vertex_node.get_neighbors()
-            curr_dist = distances[spt_set.index(vertex)]
-
-            for neighbor in neighbors:
-                if isinstance(neighbor, int) and neighbor not in spt_set:
-                    if next_vertex is None or (next_vertex and next_vertex > neighbor):
-                        next_vertex = neighbor
-                        min_dist = curr_dist + 1
-                elif isinstance(neighbor, list) and neighbor[1] + curr_dist < min_dist and neighbor[0] not in spt_set:
-                    next_vertex = neighbor[0]
-                    min_dist = neighbor[1] + curr_dist
-
-        if next_vertex is not None:
-            spt_set.append(next_vertex)
-            distances.append(min_dist)
-
-    def _adjacency_min_distance(self, spt_set, distances):
-        next_vertex = None
-        min_dist = maxsize
-
-        for vertex in spt_set:
-            vertex_node = self._graph.get_vertex(vertex)
-            if len(vertex_node[1]) == 0:
-                continue
+        # only the all-pairs and bellman ford results are ordered, so vertices are sorted on first use there
+        self._sorted_vertices = None
+        self._vertex_ids = None
 
-            neighbors = vertex_node[1]
-            neighbors = [node if node[1] is not None else [node[0], 1] for node in neighbors]
-            curr_dist = distances[spt_set.index(vertex)]
+    def _get_sorted_vertices(self):
+        if self._sorted_vertices is None:
+            self._sorted_vertices = sorted(self._graph.vertices)
+            self._vertex_ids = {vertex: index for index, vertex in enumerate(self._sorted_vertices)}
 
-            for neighbor in neighbors:
-                if neighbor[1] + curr_dist < min_dist and neighbor[0] not in spt_set:
-                    next_vertex = neighbor[0]
-                    min_dist = neighbor[1] + curr_dist
+        return self._sorted_vertices
 
-        if next_vertex is not None:
-            spt_set.append(next_vertex)
-            distances.append(min_dist)
-
-    def dijkstras(self, start_node=None):
-        spt_set = []
-        distances = []
-
-        if 'Graph' in self._type:
+    def _iter_weighted_neighbors(self, node):
+        if self._type == 'UnweightedGraph':
+            for neighbor in node.get_neighbors():
+                yield neighbor, 1
+        elif self._type == 'WeightedGraph':
+            for neighbor, weight in node.get_neighbors():
+                yield neighbor, weight
+        elif self._type == 'AdjacencyList':
+            for neighbor, weights in self._graph.adjacency_list[node].items():
+                for weight in weights:
+                    yield neighbor, 1 if weight is None else weight
+        elif self._type == 'AdjacencyMatrix':
+            row = self._graph.adjacency_matrix[self._graph.vertices[node]]
+            for i in np.flatnonzero(row).tolist():
+                weight = row[i].item()
+                yield self._idx_to_vertex[i], 1 if weight == 1 else weight - 2 if weight > 0 else weight
+
+    def dijkstras(self, start_node=None, adjacency=None):
+        if adjacency is not None:
+            nodes = None
+        elif 'Graph' in self._type:
             start_node = self._graph.get_vertex(start_node) if start_node else self._graph.get_start_vertex()
-            spt_set.append(start_node.value)
-            distances.append(0)
-
-            for i in range(len(self._graph.vertices)):
-                self._graph_min_distance(spt_set, distances)
-
-            return [start_node.value, dict([(spt_set[i], distances[i]) for i in range(len(spt_set))])]
+            start_node = start_node.value
+            nodes = self._graph.vertices
         else:
             if start_node is None:
                 start_node = self._graph.get_start_vertex()
+            nodes = None
+
+        spt_set = {}
+        distances = {start_node: 0}
+        heap = [(0, start_node)]
+
+        while heap:
+            distance, vertex = heappop(heap)
+            if vertex in spt_set:
+                continue
+            spt_set[vertex] = distance
 
-            spt_set.append(start_node)
-            distances.append(0)
+            if adjacency is not None:
+                neighbors = adjacency[vertex]
+            else:
+                neighbors = self._iter_weighted_neighbors(nodes[vertex] if nodes else vertex)
 
-            for i in range(len(self._graph.vertices)):
-                self._adjacency_min_distance(spt_set, distances)
+            for neighbor, weight in neighbors:
+                new_distance = distance + weight
+                if neighbor not in spt_set and new_distance < distances.get(neighbor, inf):
+                    distances[neighbor] = new_distance
+                    heappush(heap, (new_distance, neighbor))
 
-            return [start_node, dict([(spt_set[i], distances[i]) for i in range(len(spt_set))])]
+        return [start_node, spt_set]
 
     def floyd_warshall(self):
         adjacency_matrix = self._graph
@@ -95,50 +90,43 @@ class ShortestPaths:
         elif self._type == 'AdjacencyList':
             adjacency_matrix = Conversions.adjacency_list_to_adjacency_matrix(adjacency_matrix)
 
-        dist_dict = {}
-        distances = []
-
-        for row in adjacency_matrix.vertices:
-            for col in adjacency_matrix.vertices:
-                matrix_dist = adjacency_matrix.adjacency_matrix[adjacency_matrix.vertices[row],
-                                                                adjacency_matrix.vertices[col]]
-                matrix_dist = inf if matrix_dist == 0 else matrix_dist
-                if matrix_dist == 2:
-                    matrix_dist -= 1
-                elif matrix_dist > 1:
-                    matrix_dist -= 2
-
-                dist_dict[(row, col)] = matrix_dist
-
-        dist_dict = dict(sorted(dist_dict.items()))
-
-        for vertex in sorted(adjacency_matrix.vertices):
-            vertex_row = list()
-            for pair in dist_dict:
-                if pair[0] == vertex:
-                    if pair[0] == pair[1] and dist_dict[pair] == inf:
-                        vertex_row.append(0)
-                    else:
-                        vertex_row.append(dist_dict[pair])
-
-            distances.append(vertex_row)
-
-        for k in range(len(adjacency_matrix.vertices)):
-            for i in range(len(adjacency_matrix.vertices)):
-                for j in range(len(adjacency_matrix.vertices)):
-                    if distances[i][k] == inf or distances[k][j] == inf:
-                        continue
-
-                    distances[i][j] = min(distances[i][j], distances[i][k] + distances[k][j])
+        vertices = self._get_sorted_vertices()
+        order = [adjacency_matrix.vertices[vertex] for vertex in vertices]
+        matrix = adjacency_matrix.adjacency_matrix[np.ix_(order, order)]
+
+        distances = np.where(matrix >= 2, matrix - 2, matrix)
+
+        # missing edges hold a sentinel above three times the total edge weight, so any walk through one
+        # is longer than every real path. Distances are clamped to +-sentinel, so sums of two never
+        # leave the dtype range even when negative cycles keep lowering them
+        total = int(np.abs(distances).sum(dtype=object)) if len(distances) else 0
+        unreachable = 3 * total + 1
+        if unreachable < 2 ** 30:
+            dtype = np.int32
+        elif unreachable < 2 ** 62:
+            dtype = np.int64
+        else:
+            dtype = object
+        distances = distances.astype(dtype)
+        distances[matrix == 0] = unreachable
+        np.fill_diagonal(distances, np.where(np.diag(matrix) == 0, 0, np.diag(distances)))
+
+        # which pairs have any path at all is tracked separately, as negative cycles can pull the
+        # distance of an unreachable pair below the sentinel
+        reachable = matrix != 0
+        np.fill_diagonal(reachable, True)
+
+        candidates = np.empty_like(distances)
+        for k in range(len(distances)):
+            np.add(distances[:, k, None], distances[None, k, :], out=candidates)
+            np.minimum(distances, candidates, out=distances)
+            np.maximum(distances, -unreachable, out=distances)
+            reachable |= reachable[:, k, None] & reachable[None, k, :]
 
         output = {}
-        for row in sorted(adjacency_matrix.vertices):
-            vertex_paths = []
-            for col in sorted(adjacency_matrix.vertices):
-                vertex_paths.append([col, distances[row][col]])
-
-            output[row] = vertex_paths
-            row += 1
+        for row, row_distances, row_reachable in zip(vertices, distances.tolist(), reachable.tolist()):
+            output[row] = [[col, distance if is_reachable else inf]
+                           for col, distance, is_reachable in zip(vertices, row_distances, row_reachable)]
 
         return output
 
@@ -147,93 +135,94 @@ class ShortestPaths:
 
         for vertex in self._graph.vertices:
             if 'Graph' in self._type:
-                neighbors = vertex.get_neighbors()
-
-                for edge in neighbors:
-                    if isinstance(edge, int):
-                        if (vertex.value, edge) not in edges and (edge, vertex.value) not in edges:
-                            edges[(vertex.value, edge)] = 1
-                    elif (vertex.value, edge[0]) not in edges and (edge[0], vertex.value) not in edges:
-                        edges[(vertex.value, edge[0])] = edge[1]
+                source, neighbors = vertex, self._graph.vertices[vertex].get_neighbors()
             else:
-                neighbors = self._graph.get_vertex(vertex)[1]
-
-                for edge in neighbors:
-                    if isinstance(edge, int):
-                        if (vertex, edge) not in edges and (edge, vertex) not in edges:
-                            edges[(vertex, edge)] = 1
-                    elif (vertex, edge[0]) not in edges and (edge[0], vertex) not in edges:
-                        edges[(vertex, edge[0])] = edge[1]
-
-        edges = sorted(edges.items(), key=lambda x: x[0])
-        edges = [[*edge[0], edge[1]] for edge in edges]
-        return edges
-
-    def bellman_ford(self, start_node=None):
-        if start_node is None:
+                source, neighbors = vertex, self._graph.get_vertex(vertex)[1]
+
+            for edge in neighbors:
+                target, weight = (edge, 1) if self._type == 'UnweightedGraph' else edge
+                # parallel edges only ever take the cheapest one, unweighted edges count as 1
+                if isinstance(weight, list):
+                    weight = min(weight)
+                elif weight is None:
+                    weight = 1
+                key = (source, target) if self._graph.directed else (min(source, target), max(source, target))
+                if key not in edges or weight < edges[key]:
+                    edges[key] = weight
+
+        return [[*edge, weight] for edge, weight in edges.items()]
+
+    def bellman_ford(self, start_node=None, virtual_zero_source=False):
+        if start_node is None and not virtual_zero_source:
             start_node = self._graph.get_start_vertex()
 
-        distances = dict()
         edges = self._get_edges()
 
-        if 'Graph' in self._type:
-            for vertex in sorted(self._graph.vertices, key=lambda x: x.value):
-                distances[vertex.value] = inf if vertex.value != start_node else 0
+        # a zero weight edge from a virtual source to every vertex leaves every distance at 0 after the first round
+        distances = dict.fromkeys(self._get_sorted_vertices(), 0 if virtual_zero_source else inf)
+        if start_node in distances:
+            distances[start_node] = 0
+
+        vertex_ids = self._vertex_ids
+        edges = [edge for edge in edges if edge[0] in vertex_ids and edge[1] in vertex_ids]
+        if not self._graph.directed:
+            edges += [[vertex2, vertex1, weight] for vertex1, vertex2, weight in edges]
+        sources = np.fromiter((vertex_ids[edge[0]] for edge in edges), dtype=np.intp, count=len(edges))
+        targets = np.fromiter((vertex_ids[edge[1]] for edge in edges), dtype=np.intp, count=len(edges))
+        weights = [1 if edge[2] is None else edge[2] for edge in edges]
+
+        # integer weights are relaxed exactly, unreached vertices hold a sentinel above any walk of n edges.
+        # Fractional weights fall back to floats with inf for unreached vertices
+        integral = all(isinstance(weight, (int, np.integer)) for weight in weights)
+        if integral:
+            unreachable = len(distances) * max((abs(int(weight)) for weight in weights), default=0) + 1
+            dtype = np.int64 if unreachable < 2 ** 62 else object
+            weights = np.array([int(weight) for weight in weights], dtype=dtype)
+            dist = np.array([unreachable if distance == inf else distance for distance in distances.values()],
+                            dtype=dtype)
         else:
-            for vertex in sorted(self._graph.vertices):
-                distances[vertex] = inf if vertex != start_node else 0
+            unreachable = inf
+            weights = np.array(weights, dtype=np.float64)
+            dist = np.fromiter(distances.values(), dtype=np.float64, count=len(distances))
 
+        # only edges leaving a vertex whose distance changed in the previous round can relax anything
+        active = dist != unreachable
         for i in range(len(self._graph.vertices) - 1):
-            for vertex1, vertex2, weight in edges:
-                weight = 0 if weight is None else weight
-                if distances[vertex1] != inf and distances[vertex1] + weight < distances[vertex2]:
-                    distances[vertex2] = distances[vertex1] + weight
-
-        return distances
-
-    def johnsons(self):
-        raise AlgorithmNotImplementedError("Johnsons is unsupported")
-
-        new_graph = deepcopy(self._graph)
-        original_graph = deepcopy(self._graph)
-
-        for vertex in self._graph.vertices:
-            new_graph.remove_vertex(vertex.value if 'Graph' in self._type else vertex)
-
-        new_graph.add_vertex(inf)
-        if self._type == 'WeightedGraph':
-            new_graph.default_weight = 0
-
-        self._graph = new_graph + self._graph
+            relax = active[sources]
+            if not relax.any():
+                break
 
-        reweight = self.bellman_ford(inf)
-        self._graph.remove_vertex(inf)
-        del reweight[inf]
+            previous = dist.copy()
+            np.minimum.at(dist, targets[relax], dist[sources[relax]] + weights[relax])
+            active = dist < previous
 
-        edges = self._get_edges()
+        return {vertex: inf if distance == unreachable else distance
+                for vertex, distance in zip(distances, dist.tolist())}
 
-        print(self._graph)
+    def johnsons(self):
+        reweight = self.bellman_ford(virtual_zero_source=True)
+        adjacency = {vertex: [] for vertex in self._get_sorted_vertices()}
 
-        for vertex1, vertex2, weight in edges:
-            if weight is None:
-                weight = 0
+        for vertex1, vertex2, weight in self._get_edges():
+            if vertex1 not in adjacency or vertex2 not in adjacency:
+                continue
 
-            self._graph.remove_edge(vertex1, vertex2)
-            self._graph.add_edge(vertex1, vertex2, (weight + reweight[vertex1] - reweight[vertex2]))
+            # unweighted edges count as 1, as in dijkstras and floyd warshall
+            weight = 1 if weight is None else weight
+            adjacency[vertex1].append((vertex2, weight + reweight[vertex1] - reweight[vertex2]))
+            if not self._graph.directed:
+                adjacency[vertex2].append((vertex1, weight + reweight[vertex2] - reweight[vertex1]))
 
-        print(self._graph)
-        print(reweight)
+        # bellman ford leaves every reweighted edge non-negative unless the graph has a negative cycle
+        if any(weight < 0 for neighbors in adjacency.values() for _, weight in neighbors):
+            raise NegativeCycleError(f"This {self._graph.name()} contains a negative cycle. Johnsons is "
+                                     f"incompatible with negative cycles.")
 
         distances = dict()
 
-        for vertex in self._graph.vertices:
-            if 'Graph' in self._type:
-                distances[vertex.value] = self.dijkstras(vertex.value)[1]
-            else:
-                distances[vertex] = self.dijkstras(vertex)[1]
+        for vertex in self._get_sorted_vertices():
+            spt_set = self.dijkstras(vertex, adjacency)[1]
+            distances[vertex] = {target: distance - reweight[vertex] + reweight[target]
+                                 for target, distance in spt_set.items()}
 
-        for vertex in distances:
-            print(distances[vertex])
-
-        self._graph = original_graph
-        return distances
\ No newline at end of file
+        return distances
@@ -3,7 +3,10 @@
 from Graph_Algorithms.algorithm_exceptions import *
 from Graph_Types.graph_exceptions import *
 from Graph_Algorithms.cycles import Cycles
+from collections import deque
 from sys import maxsize
+import numpy as np
+from operator import attrgetter, itemgetter
 
 
 class Traversals:
@@ -14,6 +17,28 @@ class Traversals:
         if self._type not in ["UnweightedGraph", "WeightedGraph", "AdjacencyList", "AdjacencyMatrix"]:
             raise UnsupportedGraphTypeError(f"Invalid graph type: {self._type}")
 
+        self._find_neighbors = {'UnweightedGraph': self._neighbors_unweighted,
+                               'WeightedGraph': self._neighbors_weighted,
+                               'AdjacencyList': self._neighbors_adjlist,
+                               'AdjacencyMatrix': self._neighbors_adjmat}[self._type]
+        self._is_graph_type = self._type in ("UnweightedGraph", "WeightedGraph")
+        self._value_of = attrgetter('value') if self._is_graph_type else (lambda v: v)
+        self._reset_neighbors_cache()
+
+    # neighbors are cached on first use, so the graph is assumed not to change during a traversal. Every public
+    # traversal starts from an empty cache, so changes made to the graph between calls are picked up
+    def _reset_neighbors_cache(self):
+        self._neighbors_cache = {}
+        self._idx_to_vertex = {}
+        if self._type == 'AdjacencyMatrix':
+            self._idx_to_vertex = {index: vertex for vertex, index in self._graph.vertices.items()}
+
+    def _get_neighbors(self, node):
+        if node not in self._neighbors_cache:
+            self._neighbors_cache[node] = tuple(self._find_neighbors(node))
+
+        return self._neighbors_cache[node]
+
     def _verify_root_node(self, start_node=None):
         if start_node:
             try:
@@ -30,42 +55,41 @@ class Traversals:
         except VertexDoesNotExistError:
             raise InvalidTraversalNodeError(f"Target Vertex: {target_node} not present in graph") from None
 
-    def _get_neighbors(self, node):
-        if self._type == 'UnweightedGraph':
-            return node.get_neighbors()
-        elif self._type == 'WeightedGraph':
-            return [neighbor[0] for neighbor in sorted(node.get_neighbors(), key=lambda neighbor: neighbor[1])]
-        elif self._type == 'AdjacencyList':
-            return [neighbor[0] for neighbor in sorted([[neighbor[0], -maxsize if neighbor[1] is None else
-            neighbor[1]] for neighbor in self._graph.adjacency_list[node]], key=lambda neighbor: (neighbor[1],
-                                                                                                  neighbor[0]))]
-        elif self._type == 'AdjacencyMatrix':
-            neighbors = []
-            for i in range(len(self._graph.adjacency_matrix[self._graph.vertices[node]])):
-                if self._graph.adjacency_matrix[self._graph.vertices[node]][i] != 0:
-                    vertex2 = list(self._graph.vertices.keys())[list(self._graph.vertices.values()).index(i)]
-                    tgt_weight = self._graph.adjacency_matrix[self._graph.vertices[node], self._graph.vertices[vertex2]]
-                    if tgt_weight == 1:
-                        tgt_weight = None
-                    else:
-                        tgt_weight = tgt_weight - 2 if tgt_weight > 0 else tgt_weight
-                    neighbors.append([vertex2, tgt_weight])
-
-            return [neighbor[0] for neighbor in sorted([[neighbor[0], -maxsize if neighbor[1] is None else
-            neighbor[1]] for neighbor in neighbors], key=lambda neighbor: (neighbor[1], neighbor[0]))]
+    def _neighbors_unweighted(self, node):
+        return node.get_neighbors()
+
+    def _neighbors_weighted(self, node):
+        return [neighbor[0] for neighbor in sorted(node.get_neighbors(), key=itemgetter(1))]
+
+    def _neighbors_adjlist(self, node):
+        return [neighbor[1] for neighbor in sorted((-maxsize if weight is None else weight, neighbor)
+                                                   for neighbor, weights in self._graph.adjacency_list[node].items()
+                                                   for weight in weights)]
+
+    def _neighbors_adjmat(self, node):
+        row = self._graph.adjacency_matrix[self._graph.vertices[node]]
+        targets = np.flatnonzero(row)
+        weights = row[targets]
+        weights = np.where(weights == 1, -maxsize, np.where(weights > 0, weights - 2, weights))
+
+        return [neighbor[1] for neighbor in sorted(zip(weights.tolist(), [self._idx_to_vertex[i] for i in
+                                                                          targets.tolist()]))]
 
     def bft(self, start_node=None):
+        self._reset_neighbors_cache()
         start_node = self._verify_root_node(start_node)
         visited = []
 
         if 'Graph' in self._type:
             visited = [start_node.value]
-            neighbors = self._get_neighbors(start_node)
+            seen = {start_node.value}
+            neighbors = deque(self._get_neighbors(start_node))
 
             while neighbors:
-                temp_node = neighbors.pop(0)
-                if temp_node not in visited:
+                temp_node = neighbors.popleft()
+                if temp_node not in seen:
                     visited.append(temp_node)
+                    seen.add(temp_node)
                     temp_node = self._graph.get_vertex(temp_node)
                     neighbors.extend(self._get_neighbors(temp_node))
 
@@ -74,12 +98,14 @@ class Traversals:
                                                f"vertex {visited[-1]} is disconnected")
         elif 'Adjacency' in self._type:
             visited = [start_node]
-            neighbors = self._get_neighbors(start_node)
+            seen = {start_node}
+            neighbors = deque(self._get_neighbors(start_node))
 
             while neighbors:
-                temp_node = neighbors.pop(0)
-                if temp_node not in visited:
+                temp_node = neighbors.popleft()
+                if temp_node not in seen:
                     visited.append(temp_node)
+                    seen.add(temp_node)
                     neighbors.extend(self._get_neighbors(temp_node))
 
             if self._type == 'AdjacencyList':
@@ -92,21 +118,24 @@ class Traversals:
         return visited
 
     def bfs(self, target_node, start_node=None):
+        self._reset_neighbors_cache()
         start_node = self._verify_root_node(start_node)
+        if self._value_of(start_node) == target_node:
+            return [self._value_of(start_node)]
+
         self._verify_target_node(target_node)
         visited = []
 
         if 'Graph' in self._type:
             visited = [start_node.value]
-            if start_node.value == target_node:
-                return visited
-
-            neighbors = self._get_neighbors(start_node)
+            seen = {start_node.value}
+            neighbors = deque(self._get_neighbors(start_node))
 
             while neighbors:
-                temp_node = neighbors.pop(0)
-                if temp_node not in visited:
+                temp_node = neighbors.popleft()
+                if temp_node not in seen:
                     visited.append(temp_node)
+                    seen.add(temp_node)
                     if temp_node == target_node:
                         return visited
                     temp_node = self._graph.get_vertex(temp_node)
@@ -114,37 +143,42 @@ class Traversals:
 
         elif 'Adjacency' in self._type:
             visited = [start_node]
-            if start_node == target_node:
-                return visited
-
-            neighbors = self._get_neighbors(start_node)
+            seen = {start_node}
+            neighbors = deque(self._get_neighbors(start_node))
 
             while neighbors:
-                temp_node = neighbors.pop(0)
-                if temp_node not in visited:
+                temp_node = neighbors.popleft()
+                if temp_node not in seen:
                     visited.append(temp_node)
+                    seen.add(temp_node)
                     if temp_node == target_node:
                         return visited
                     neighbors.extend(self._get_neighbors(temp_node))
 
         return visited
 
-    def _dft_recurse(self, node, visited):
-        visited.append(node.value if 'Graph' in self._type else node)
-        neighbors = self._get_neighbors(node)
-
-        while neighbors:
-            temp_node = neighbors.pop(0)
-            if temp_node not in visited:
-                if 'Graph' in self._type:
+    def _dft_walk(self, start_node, visited, seen):
+        visited.append(self._value_of(start_node))
+        seen.add(visited[-1])
+        stack = [iter(self._get_neighbors(start_node))]
+
+        while stack:
+            temp_node = next(stack[-1], None)
+            if temp_node is None:
+                stack.pop()
+            elif temp_node not in seen:
+                visited.append(temp_node)
+                seen.add(temp_node)
+                if self._is_graph_type:
                     temp_node = self._graph.get_vertex(temp_node)
 
-                self._dft_recurse(temp_node, visited)
+                stack.append(iter(self._get_neighbors(temp_node)))
 
     def dft(self, start_node=None):
+        self._reset_neighbors_cache()
         start_node = self._verify_root_node(start_node)
         visited = []
-        self._dft_recurse(start_node, visited)
+        self._dft_walk(start_node, visited, set())
 
         if 'Graph' in self._type and len(visited) != len(self._graph.vertices):
             raise IncompleteTraversalError(f"Incomplete depth first traversal of graph: {visited}, "
@@ -157,46 +191,59 @@ class Traversals:
                                            f"vertex {visited[-1]} is disconnected")
         return visited
 
-    def _dfs_recurse(self, node, target, visited):
-        visited.append(node.value if 'Graph' in self._type else node)
-
-        if ('Graph' in self._type and node.value == target.value) or node == target:
-            return visited
-
-        neighbors = self._get_neighbors(node)
-        while neighbors:
-            temp_node = neighbors.pop(0)
-            if temp_node not in visited:
-                if 'Graph' in self._type:
+    def _dfs_walk(self, start_node, target, visited, seen):
+        visited.append(self._value_of(start_node))
+        seen.add(visited[-1])
+        stack = [iter(self._get_neighbors(start_node))]
+
+        while stack:
+            temp_node = next(stack[-1], None)
+            if temp_node is None:
+                stack.pop()
+            elif temp_node not in seen:
+                visited.append(temp_node)
+                seen.add(temp_node)
+                if temp_node == target:
+                    return visited
+
+                if self._is_graph_type:
                     temp_node = self._graph.get_vertex(temp_node)
 
-                if self._dfs_recurse(temp_node, target, visited):
-                    return True
+                stack.append(iter(self._get_neighbors(temp_node)))
+
+        return visited
 
     def dfs(self, target_node, start_node=None):
+        self._reset_neighbors_cache()
         start_node = self._verify_root_node(start_node)
+        if self._value_of(start_node) == target_node:
+            return [self._value_of(start_node)]
+
         self._verify_target_node(target_node)
         visited = []
-        self._dfs_recurse(start_node, target_node, visited)
+        self._dfs_walk(start_node, target_node, visited, set())
 
         return visited
 
-    def _topological_recurse(self, node, visited, stack):
-        visited.append(node.value if 'Graph' in self._type else node)
-        neighbors = self._get_neighbors(node)
-
-        while neighbors:
-            temp_node = neighbors.pop(0)
-            if temp_node not in visited:
-                if 'Graph' in self._type:
+    def _topological_walk(self, start_node, seen, order):
+        seen.add(self._value_of(start_node))
+        stack = [(start_node, iter(self._get_neighbors(start_node)))]
+
+        while stack:
+            node, neighbors = stack[-1]
+            temp_node = next(neighbors, None)
+            if temp_node is None:
+                stack.pop()
+                order.append(self._value_of(node))
+            elif temp_node not in seen:
+                seen.add(temp_node)
+                if self._is_graph_type:
                     temp_node = self._graph.get_vertex(temp_node)
 
-                self._topological_recurse(temp_node, visited, stack)
-
-        if ('Graph' in self._type and node.value not in stack) or (node not in stack):
-            stack.append(node.value if 'Graph' in self._type else node)
+                stack.append((temp_node, iter(self._get_neighbors(temp_node))))
 
     def topological(self):
+        self._reset_neighbors_cache()
         if not self._graph.directed:
             raise UnsupportedGraphTypeError(f"This {self._graph.name()} is an undirected graph. Topological Sort is "
                                             f"incompatible with undirected graphs.")
@@ -205,10 +252,11 @@ class Traversals:
         if cycle.detect_cycle()[0]:
             raise UnsupportedGraphTypeError(f"This {self._graph.name()} is a cyclic graph. Topological Sort is "
                                             f"incompatible with cyclic graphs.")
-        visited = []
-        stack = []
+        seen = set()
+        order = []
 
-        for vertex in self._graph.vertices:
-            self._topological_recurse(vertex, visited, stack)
+        for vertex in self._graph.vertices.values() if self._is_graph_type else self._graph.vertices:
+            if self._value_of(vertex) not in seen:
+                self._topological_walk(vertex, seen, order)
 
-        return stack[::-1]
+        return order[::-1]
@@ -3,28 +3,54 @@
    common graph operations such as union, intersection, difference and join.
 """
 
-from copy import deepcopy
 from collections import Counter
 from .graph_exceptions import *
 
+_NAMES = {(True, True): "Directed Multi-Edged Adjacency List",
+          (True, False): "Directed Adjacency List",
+          (False, True): "Undirected Multi-Edged Adjacency List",
+          (False, False): "Undirected Adjacency List"}
+
 
 class AdjacencyList:
+
+    __slots__ = ("adjacency_list", "directed", "multiple_edges")
     
     def __init__(self, directed=True, multiple_edges=False):
         self.adjacency_list = {}
-        self.vertices = set()
         self.directed = directed
         self.multiple_edges = multiple_edges
 
-    def get_start_vertex(self):
+    @property
+    def vertices(self):
         """
 
+        Returns
+        -------
+        dict_keys
+            a live view of the vertices in this Adjacency List
+
+        """
+        return self.adjacency_list.keys()
+
+    def get_start_vertex(self, deterministic=True):
+        """
+
+        Parameters
+        ----------
+        deterministic : bool
+            if true, the smallest vertex is returned, otherwise the first vertex is returned
+            without scanning the whole Adjacency List
+
         Returns
         -------
         vertex
             a random vertex from this Adjacency List
 
         """
+        if not deterministic:
+            return next(iter(self.adjacency_list))
+
         return min(self.adjacency_list.keys())
 
     def verify_vertex_present(self, vertex):
@@ -77,12 +103,8 @@ class AdjacencyList:
         """
         self.verify_vertex_present(vertex)
 
-        for node in self.vertices:
-            if node == vertex:
-                return [node, [temp_vertex for temp_vertex in self.adjacency_list[node]]]
-
-        # Unreachable
-        return None
+        return [vertex, [[neighbor, weight] for neighbor, weights in self.adjacency_list[vertex].items()
+                         for weight in weights]]
 
     def add_vertex(self, vertex):
         """
@@ -104,8 +126,7 @@ class AdjacencyList:
 
         """
         self.verify_vertex_not_present(vertex)
-        self.adjacency_list[vertex] = []
-        self.vertices.add(vertex)
+        self.adjacency_list[vertex] = {}
         
         return True
         
@@ -130,7 +151,6 @@ class AdjacencyList:
         """
         self.verify_vertex_present(vertex)
         del self.adjacency_list[vertex]
-        self.vertices.discard(vertex)
 
         self._update_edges()
         
@@ -164,18 +184,61 @@ class AdjacencyList:
         self.verify_vertex_present(vertex1)
         self.verify_vertex_present(vertex2)
         
-        temp_list = self.adjacency_list[vertex1]
-        
+        if not self.multiple_edges and vertex2 in self.adjacency_list[vertex1]:
+            raise NeighborAlreadyExistsError(f"Neighbor: {vertex2}: "
+                                             f"already present for vertex: {vertex1}")
+
+        if not self.directed and vertex1 != vertex2:
+            self.adjacency_list[vertex2].setdefault(vertex1, []).append(weight)
+
+        self.adjacency_list[vertex1].setdefault(vertex2, []).append(weight)
+
+        return True
+
+    def add_edges(self, edges):
+        """
+
+        Parameters
+        ----------
+        edges : iterable
+            (vertex1, vertex2) or (vertex1, vertex2, weight) edges to add. Edges are only added
+            if all of them are valid
+
+        Raises
+        ------
+        VertexDoesNotExistError
+            if any of the given vertices do not exist
+        NeighborAlreadyExistsError
+            if any of the given edges already exists, or is given more than once
+
+        Returns
+        -------
+        bool
+            True on success
+
+        """
+        edges = [(edge[0], edge[1], edge[2] if len(edge) > 2 else None) for edge in edges]
+
+        missing = [vertex for vertex in dict.fromkeys(vertex for edge in edges for vertex in edge[:2])
+                   if vertex not in self.adjacency_list]
+        if missing:
+            raise VertexDoesNotExistError(f"Vertices: {missing}: not present in graph")
+
         if not self.multiple_edges:
-            for i in range(len(temp_list)):
-                if temp_list[i][0] == vertex2:
+            pending = set()
+            for vertex1, vertex2, weight in edges:
+                if vertex2 in self.adjacency_list[vertex1] or (vertex1, vertex2) in pending:
                     raise NeighborAlreadyExistsError(f"Neighbor: {vertex2}: "
                                                      f"already present for vertex: {vertex1}")
+                pending.add((vertex1, vertex2))
+                if not self.directed:
+                    pending.add((vertex2, vertex1))
 
-        if not self.directed and vertex1 != vertex2:
-            self.adjacency_list[vertex2].append([vertex1, weight])
+        for vertex1, vertex2, weight in edges:
+            if not self.directed and vertex1 != vertex2:
+                self.adjacency_list[vertex2].setdefault(vertex1, []).append(weight)
 
-        self.adjacency_list[vertex1].append([vertex2, weight])
+            self.adjacency_list[vertex1].setdefault(vertex2, []).append(weight)
 
         return True
     
@@ -207,19 +270,16 @@ class AdjacencyList:
         self.verify_vertex_present(vertex1)
         self.verify_vertex_present(vertex2)
 
-        original_list = deepcopy(self.adjacency_list[vertex1])
-        temp_list = sorted([[edge[0], 0] if edge[1] is None
-                            else edge for edge in self.adjacency_list[vertex1]],
-                           key=lambda x: x[1], reverse=True)
+        weights = self.adjacency_list[vertex1].get(vertex2, ())
         target = None
 
-        for i in range(len(temp_list)):
-            if weight is not None and temp_list[i][0] == vertex2 and temp_list[i][1] == weight:
-                target = [vertex2, weight]
-                break
-            elif weight is None and temp_list[i][0] == vertex2:
-                target = [vertex2, temp_list[i][1]]
-                break
+        # without a weight the heaviest edge is removed, with unweighted edges counting as 0
+        if weight is None and weights:
+            target = [vertex2, max(weights, key=lambda x: (0, False) if x is None else (x, True))]
+        elif weight is not None and weight in weights:
+            target = [vertex2, weight]
+        elif weight == 0 and None in weights:
+            target = [vertex2, None]
 
         if not target and weight is None:
             raise NeighborDoesNotExistError(f"Neighbor: {vertex2}: not present for vertex: {vertex1}")
@@ -227,14 +287,20 @@ class AdjacencyList:
             raise NeighborDoesNotExistError(
                 f"Neighbor: {vertex2} with weight: {weight}, not present for vertex: {vertex1}")
         else:
-            if not self.directed:
-                self.adjacency_list[vertex2].remove([vertex1, None if target[1] == 0 else target[1]])
+            self._remove_weight(vertex1, vertex2, target[1])
+            if not self.directed and vertex1 != vertex2:
+                self._remove_weight(vertex2, vertex1, target[1])
 
-            if target in original_list:
-                original_list.remove(target)
-            else:
-                original_list.remove([target[0], None if target[1] == 0 else target[1]])
-            self.adjacency_list[vertex1] = original_list
+    def _remove_weight(self, vertex1, vertex2, weight):
+        """
+
+        Helper function. Removes one edge with the given weight, and the neighbor once no edges remain
+
+        """
+        weights = self.adjacency_list[vertex1][vertex2]
+        weights.remove(weight)
+        if not weights:
+            del self.adjacency_list[vertex1][vertex2]
 
     def is_neighbor(self, vertex1, vertex2):
         """
@@ -252,14 +318,7 @@ class AdjacencyList:
             if vertex2 is a neighbor of vertex1
 
         """
-        if vertex1 not in self.adjacency_list:
-            return False
-
-        for i in range(len(self.adjacency_list[vertex1])):
-            if self.adjacency_list[vertex1][i][0] == vertex2:
-                return True
-
-        return False
+        return vertex2 in self.adjacency_list.get(vertex1, ())
 
     def _update_edges(self):
         """
@@ -267,10 +326,50 @@ class AdjacencyList:
         Helper function. Removes edges to phantom vertices
 
         """
-        for vertex in self.adjacency_list.keys():
-            for i in range(len(self.adjacency_list[vertex])):
-                if self.adjacency_list[vertex][i][0] not in self.adjacency_list.keys():
-                    del self.adjacency_list[vertex][i]
+        alive = self.adjacency_list.keys()
+        for vertex, edges in self.adjacency_list.items():
+            self.adjacency_list[vertex] = {neighbor: weights for neighbor, weights in edges.items()
+                                           if neighbor in alive}
+
+    def _merge_edges(self, edges, other_edges):
+        """
+
+        Helper function. Adds other_edges into edges, skipping edges already present unless
+        this Adjacency List supports multiple edges
+
+        """
+        for neighbor, weights in other_edges.items():
+            temp_weights = edges.setdefault(neighbor, [])
+            if self.multiple_edges:
+                temp_weights.extend(weights)
+                continue
+
+            seen = set(temp_weights)
+            for weight in weights:
+                if weight not in seen:
+                    temp_weights.append(weight)
+                    seen.add(weight)
+
+    def _add_join_edge(self, edges, neighbor):
+        """
+
+        Helper function. Adds an unweighted join edge to neighbor, unless this Adjacency List does not
+        support multiple edges and one is already present
+
+        """
+        weights = edges.setdefault(neighbor, [])
+        if self.multiple_edges or None not in weights:
+            weights.append(None)
+
+    def _copy_adjacency_list(self, vertices):
+        """
+
+        Helper function. Copies the edges of the given vertices, cloning only the weight lists since
+        those are the only layer later written to
+
+        """
+        return {vertex: {neighbor: weights.copy() for neighbor, weights in self.adjacency_list[vertex].items()}
+                for vertex in vertices}
 
     def empty(self):
         """
@@ -305,30 +404,9 @@ class AdjacencyList:
         if not isinstance(other, AdjacencyList):
             raise AdjacencyListOperationError("Adjacency List union can only be performed on Adjacency Lists")
 
-        if not self.multiple_edges:
-            for vertex in self.adjacency_list.keys():
-                if vertex in other.adjacency_list:
-                    temp_list = self.adjacency_list[vertex]
-                    temp_list.extend(other.adjacency_list[vertex])
-                    temp_set = set(tuple(edge) for edge in temp_list)
-                    temp_list = [list(edge) for edge in temp_set]
-                    self.adjacency_list[vertex] = temp_list
-
-            for vertex in other.adjacency_list.keys():
-                if vertex not in self.adjacency_list:
-                    self.adjacency_list[vertex] = other.adjacency_list[vertex]
-                    temp_set = set(tuple(edge) for edge in self.adjacency_list[vertex])
-                    self.adjacency_list[vertex] = [list(edge) for edge in temp_set]
-        else:
-            for vertex in self.adjacency_list.keys():
-                if vertex in other.adjacency_list:
-                    self.adjacency_list[vertex].extend(other.adjacency_list[vertex])
-
-            for vertex in other.adjacency_list.keys():
-                if vertex not in self.adjacency_list:
-                    self.adjacency_list[vertex] = other.adjacency_list[vertex]
+        for vertex in other.adjacency_list.keys():
+            self._merge_edges(self.adjacency_list.setdefault(vertex, {}), other.adjacency_list[vertex])
 
-        self.vertices = set(self.adjacency_list.keys())
         return self
 
     def intersection(self, other):
@@ -353,32 +431,32 @@ class AdjacencyList:
         if not isinstance(other, AdjacencyList):
             raise AdjacencyListOperationError("Adjacency List intersection can only be performed on Adjacency Lists")
 
-        list_copy = deepcopy(self.adjacency_list)
+        for vertex in self.adjacency_list.keys() - other.adjacency_list.keys():
+            del self.adjacency_list[vertex]
 
-        for vertex in list_copy.keys():
-            if vertex not in other.adjacency_list:
-                del self.adjacency_list[vertex]
+        for vertex in self.adjacency_list.keys():
+            temp_edges = {}
+            other_edges = other.adjacency_list[vertex]
+            for neighbor in self.adjacency_list[vertex].keys() & other_edges.keys():
+                weights = self.adjacency_list[vertex][neighbor]
+                other_weights = other_edges[neighbor]
+                if not self.multiple_edges:
+                    temp_weights = [weight for weight in weights if weight in other_weights]
+                elif not other.multiple_edges:
+                    temp_weights = list(dict.fromkeys(weight for weight in other_weights if weight in weights))
+                else:
+                    bag = Counter(other_weights)
+                    temp_weights = []
+                    for weight in weights:
+                        if bag[weight]:
+                            temp_weights.append(weight)
+                            bag[weight] -= 1
+
+                if temp_weights:
+                    temp_edges[neighbor] = temp_weights
+
+            self.adjacency_list[vertex] = temp_edges
 
-        if not self.multiple_edges:
-            for vertex in self.adjacency_list.keys():
-                if vertex in other.adjacency_list:
-                    self.adjacency_list[vertex] = \
-                        [edge for edge in self.adjacency_list[vertex] if edge in other.adjacency_list[vertex]]
-        elif not other.multiple_edges:
-            for vertex in self.adjacency_list.keys():
-                if vertex in other.adjacency_list:
-                    temp_set = set(tuple(edge)
-                                   for edge in other.adjacency_list[vertex] if edge in self.adjacency_list[vertex])
-                    self.adjacency_list[vertex] = [list(edge) for edge in temp_set]
-        else:
-            for vertex in self.adjacency_list.keys():
-                if vertex in other.adjacency_list:
-                    self.adjacency_list[vertex] = \
-                        [list(edge) for edge in
-                         ((Counter([tuple(edge) for edge in self.adjacency_list[vertex]]) &
-                           Counter([tuple(edge) for edge in other.adjacency_list[vertex]])).elements())]
-
-        self.vertices = set(self.adjacency_list.keys())
         return self
 
     def difference(self, other):
@@ -403,14 +481,10 @@ class AdjacencyList:
         if not isinstance(other, AdjacencyList):
             raise AdjacencyListOperationError("Adjacency List difference can only be performed on Adjacency Lists")
 
-        list_copy = deepcopy(self.adjacency_list)
-
-        for vertex in list_copy.keys():
-            if vertex in other.adjacency_list:
-                del self.adjacency_list[vertex]
+        for vertex in self.adjacency_list.keys() & other.adjacency_list.keys():
+            del self.adjacency_list[vertex]
 
         self._update_edges()
-        self.vertices = set(self.adjacency_list.keys())
         return self
 
     def set_directed(self, directed):
@@ -433,12 +507,44 @@ class AdjacencyList:
             type name
 
         """
-        name_string = "Directed " if self.directed else "Undirected "
-        name_string += "Multi-Edged " if self.multiple_edges else ""
-        name_string += "Adjacency "
-        name_string += "List"
+        return _NAMES[(bool(self.directed), bool(self.multiple_edges))]
+
+    def _join(self, other, inplace):
+        """
 
-        return name_string
+        Helper function. Joins other into a copy of this Adjacency List, which either replaces this
+        Adjacency List's edges or is returned as a new Adjacency List
+
+        """
+        if not isinstance(other, AdjacencyList):
+            raise AdjacencyListOperationError("Adjacency List join can only be performed on Adjacency Lists")
+
+        list_copy = self._copy_adjacency_list(self.adjacency_list)
+
+        for vertex in other.adjacency_list.keys():
+            if vertex not in list_copy:
+                list_copy[vertex] = {}
+                self._merge_edges(list_copy[vertex], other.adjacency_list[vertex])
+
+        adjacency_list = self.adjacency_list
+        other_list = other.adjacency_list
+        for vertex, edges in adjacency_list.items():
+            for node in other_list:
+                if vertex != node:
+                    if node not in edges:
+                        self._add_join_edge(list_copy[vertex], node)
+                    if not self.directed and vertex not in adjacency_list.get(node, ()):
+                        self._add_join_edge(list_copy[node], vertex)
+                else:
+                    self._merge_edges(list_copy[vertex], other_list[vertex])
+
+        if inplace:
+            self.adjacency_list = list_copy
+            return self
+
+        joined = AdjacencyList(self.directed, self.multiple_edges)
+        joined.adjacency_list = list_copy
+        return joined
 
     def __add__(self, other):
         """
@@ -459,42 +565,7 @@ class AdjacencyList:
             the join of the Adjacency Lists as a new Adjacency List
 
         """
-        if not isinstance(other, AdjacencyList):
-            raise AdjacencyListOperationError("Adjacency List join can only be performed on Adjacency Lists")
-
-        list_copy = deepcopy(self.adjacency_list)
-        other_copy = deepcopy(other.adjacency_list)
-
-        for vertex in other_copy.keys():
-            if vertex not in list_copy:
-                if not self.multiple_edges:
-                    temp_set = set(tuple(edge) for edge in other_copy[vertex])
-                    temp_list = [list(edge) for edge in temp_set]
-                    list_copy[vertex] = temp_list
-                else:
-                    list_copy[vertex] = other.adjacency_list[vertex]
-
-        for vertex in self.adjacency_list.keys():
-            for node in other_copy.keys():
-                if vertex != node:
-                    if not self.is_neighbor(vertex, node):
-                        list_copy[vertex].append([node, None])
-                    if not self.directed and not self.is_neighbor(node, vertex):
-                        list_copy[node].append([vertex, None])
-                else:
-                    if not self.multiple_edges:
-                        temp_list = list_copy[vertex]
-                        temp_list.extend(other.adjacency_list[vertex])
-                        temp_set = set(tuple(edge) for edge in temp_list)
-                        temp_list = [list(edge) for edge in temp_set]
-                        list_copy[vertex] = temp_list
-                    else:
-                        list_copy[vertex].extend(other.adjacency_list[vertex])
-
-        adjacency_list = AdjacencyList(self.directed, self.multiple_edges)
-        adjacency_list.adjacency_list = list_copy
-        adjacency_list.vertices = set(adjacency_list.adjacency_list.keys())
-        return adjacency_list
+        return self._join(other, inplace=False)
 
     def __iadd__(self, other):
         """
@@ -515,40 +586,7 @@ class AdjacencyList:
             the join of the Adjacency Lists
 
         """
-        if not isinstance(other, AdjacencyList):
-            raise AdjacencyListOperationError("Adjacency List join can only be performed on Adjacency Lists")
-
-        list_copy = deepcopy(self.adjacency_list)
-
-        for vertex in other.adjacency_list.keys():
-            if vertex not in list_copy:
-                if not self.multiple_edges:
-                    temp_set = set(tuple(edge) for edge in other.adjacency_list[vertex])
-                    temp_list = [list(edge) for edge in temp_set]
-                    list_copy[vertex] = temp_list
-                else:
-                    list_copy[vertex] = other.adjacency_list[vertex]
-
-        for vertex in self.adjacency_list.keys():
-            for node in other.adjacency_list.keys():
-                if vertex != node:
-                    if not self.is_neighbor(vertex, node):
-                        list_copy[vertex].append([node, None])
-                    if not self.directed and not self.is_neighbor(node, vertex):
-                        list_copy[node].append([vertex, None])
-                else:
-                    if not self.multiple_edges:
-                        temp_list = list_copy[vertex]
-                        temp_list.extend(other.adjacency_list[vertex])
-                        temp_set = set(tuple(edge) for edge in temp_list)
-                        temp_list = [list(edge) for edge in temp_set]
-                        list_copy[vertex] = temp_list
-                    else:
-                        list_copy[vertex].extend(other.adjacency_list[vertex])
-
-        self.adjacency_list = list_copy
-        self.vertices = set(self.adjacency_list.keys())
-        return self
+        return self._join(other, inplace=True)
 
     def __sub__(self, other):
         """
@@ -572,17 +610,12 @@ class AdjacencyList:
         if not isinstance(other, AdjacencyList):
             raise AdjacencyListOperationError("Adjacency List difference can only be performed on Adjacency Lists")
 
-        list_copy = deepcopy(self.adjacency_list)
-
-        for vertex in self.adjacency_list.keys():
-            if vertex in other.adjacency_list:
-                del list_copy[vertex]
-
-        self._update_edges()
+        list_copy = self._copy_adjacency_list(vertex for vertex in self.adjacency_list.keys()
+                                              if vertex not in other.adjacency_list)
 
         adjacency_list = AdjacencyList(self.directed, self.multiple_edges)
         adjacency_list.adjacency_list = list_copy
-        adjacency_list.vertices = set(adjacency_list.adjacency_list.keys())
+        adjacency_list._update_edges()
         return adjacency_list
 
     def __isub__(self, other):
@@ -623,19 +656,25 @@ class AdjacencyList:
         if not isinstance(other, AdjacencyList):
             return False
         
-        if self.directed != other.directed:
+        if self.directed != other.directed or self.multiple_edges != other.multiple_edges:
             return False
         
-        if len(self.adjacency_list) != len(other.adjacency_list):
-            return False
+        if self.adjacency_list == other.adjacency_list:
+            return True
         
-        for key in other.adjacency_list.keys():
-            if key in self.adjacency_list:
-                if self.adjacency_list[key] != other.adjacency_list[key]:
-                    return False
-            else:
+        if self.adjacency_list.keys() != other.adjacency_list.keys():
+            return False
+
+        # the weights of parallel edges may have been added in a different order
+        for vertex, edges in self.adjacency_list.items():
+            other_edges = other.adjacency_list[vertex]
+            if edges.keys() != other_edges.keys():
                 return False
 
+            for neighbor, weights in edges.items():
+                if Counter(weights) != Counter(other_edges[neighbor]):
+                    return False
+
         return True
 
     def __ne__(self, other):
@@ -668,9 +707,9 @@ class AdjacencyList:
             all neighbors and weights for the given vertex
 
         """
-        temp_list = sorted([[edge[0], 0] if edge[1] is None else edge for edge in self.adjacency_list[vertex]],
-                           key=lambda x: (x[0], x[1]))
-        temp_list = [[edge[0], None] if edge[1] == 0 else edge for edge in temp_list]
+        edges = self.adjacency_list[vertex]
+        temp_list = [[neighbor, None if weight == 0 else weight] for neighbor in sorted(edges)
+                     for weight in sorted(edges[neighbor], key=lambda x: 0 if x is None else x)]
         return f"{temp_list}"
 
     def __str__(self):
@@ -682,16 +721,14 @@ class AdjacencyList:
             this Adjacency List as a string
 
         """
-        out_string = self.name() + ":\n"
-        out_dict = dict(sorted(self.adjacency_list.items()))
-        for vertex in out_dict.keys():
-            out_string += f"{vertex}: "
+        out_strings = [self.name() + ":\n"]
+        for vertex in sorted(self.adjacency_list):
             if len(self.adjacency_list[vertex]) == 0:
-                out_string += f"No neighbors\n"
+                out_strings.append(f"{vertex}: No neighbors\n")
             else:
-                out_string += f"{self._vertex_string(vertex)}\n"
+                out_strings.append(f"{vertex}: {self._vertex_string(vertex)}\n")
         
         if self.empty():
-            out_string += "Empty Adjacency List\n"
+            out_strings.append("Empty Adjacency List\n")
         
-        return out_string
+        return "".join(out_strings)
@@ -4,21 +4,63 @@
    does not support duplicate edges.
 """
 
-from copy import deepcopy
+from operator import itemgetter
 import numpy as np
 from .graph_exceptions import *
 
 
 class AdjacencyMatrix:
 
-    def __init__(self, directed=True, multiple_edges=False):
-        self.adjacency_matrix = np.array([])
+    __slots__ = ("_matrix", "_n", "vertices", "_index_to_vertex", "_neighbor_indices", "_sorted_vertices",
+                 "directed", "multiple_edges")
+
+    def __init__(self, directed=True, multiple_edges=False, dtype=np.int32):
+        # the matrix is over-allocated so vertices can be added without reallocating each time,
+        # only the top left _n x _n block is in use. Weights are stored shifted by 2 (see update_weight()),
+        # so a smaller dtype such as np.int8 suits graphs whose weights stay within -128 to 125.
+        # union() and intersection() widen the dtype as needed to hold the other matrix's weights
+        self._matrix = np.zeros((0, 0), dtype=dtype)
+        self._n = 0
         self.vertices = {}
+        self._index_to_vertex = []
+        # the neighbor indices of each row read by get_vertex, dropped whenever that row changes
+        self._neighbor_indices = {}
+        self._sorted_vertices = None
         self.directed = directed
         self.multiple_edges = False
         if multiple_edges:
             raise AdjacencyMatrixOperationError("Adjacency Matrices do not support multiple edges")
 
+    @property
+    def adjacency_matrix(self):
+        """
+
+        Returns
+        -------
+        np.ndarray
+            a read-only view of the in-use block of this Adjacency Matrix. Edges are changed through
+            add_edge()/remove_edge(), or by assigning a whole new matrix to this attribute
+
+        """
+        # writing through the view would bypass the cached neighbor lists, so the view is read-only
+        matrix = self._matrix[:self._n, :self._n]
+        matrix.flags.writeable = False
+        return matrix
+
+    @adjacency_matrix.setter
+    def adjacency_matrix(self, matrix):
+        """
+
+        Parameters
+        ----------
+        matrix : np.ndarray
+            square matrix to use as this Adjacency Matrix
+
+        """
+        self._matrix = matrix
+        self._n = len(matrix)
+        self._neighbor_indices = {}
+
     def get_start_vertex(self):
         """
 
@@ -28,7 +70,7 @@ class AdjacencyMatrix:
             a random vertex from this Adjacency Matrix
 
         """
-        return min(self.vertices, key=self.vertices.get)
+        return next(iter(self.vertices))
 
     def verify_vertex_present(self, vertex):
         """
@@ -80,23 +122,17 @@ class AdjacencyMatrix:
         """
         self.verify_vertex_present(vertex)
 
-        for node in self.vertices:
-            if node == vertex:
-                temp_node = self.adjacency_matrix[self.vertices[node]]
-                temp_neighbors = []
-                for entry in range(len(temp_node)):
-                    if temp_node[entry] != 0:
-                        weight = temp_node[entry]
-                        if weight == 1:
-                            weight = None
-                        else:
-                            weight = weight - 2 if weight > 0 else weight
-                        temp_neighbors.append([self.vertices[entry], weight])
+        index = self.vertices[vertex]
+        temp_node = self._matrix[index, :self._n]
+        neighbor_indices = self._neighbor_indices
+        if index not in neighbor_indices:
+            neighbor_indices[index] = np.flatnonzero(temp_node).tolist()
 
-                return [node, temp_neighbors]
+        targets = neighbor_indices[index]
+        weights = self._decode_weights(temp_node[targets])
+        index_to_vertex = self._index_to_vertex
 
-        # Unreachable
-        return None
+        return [vertex, [[index_to_vertex[entry], weight] for entry, weight in zip(targets, weights)]]
 
     def add_vertex(self, vertex):
         """
@@ -119,13 +155,16 @@ class AdjacencyMatrix:
         """
         self.verify_vertex_not_present(vertex)
 
-        if self.empty():
-            self.adjacency_matrix = np.array([[0] * 1] * 1)
-            self.vertices[vertex] = len(self.vertices.keys())
-        else:
-            self.vertices[vertex] = len(self.vertices.keys())
-            self.adjacency_matrix = np.insert(self.adjacency_matrix, self.vertices[vertex], values=0, axis=0)
-            self.adjacency_matrix = np.insert(self.adjacency_matrix, self.vertices[vertex], values=0, axis=1)
+        if self._n == len(self._matrix):
+            matrix = np.zeros((max(1, 2 * self._n),) * 2, dtype=self._matrix.dtype)
+            matrix[:self._n, :self._n] = self.adjacency_matrix
+            self._matrix = matrix
+
+        # rows and columns past _n are always zero, so the new vertex needs no initialization
+        self.vertices[vertex] = self._n
+        self._index_to_vertex.append(vertex)
+        self._n += 1
+        self._sorted_vertices = None
 
         return True
 
@@ -149,14 +188,22 @@ class AdjacencyMatrix:
 
         """
         self.verify_vertex_present(vertex)
-        self.adjacency_matrix = np.delete(self.adjacency_matrix, self.vertices[vertex], axis=0)
-        self.adjacency_matrix = np.delete(self.adjacency_matrix, self.vertices[vertex], axis=1)
-        del self.vertices[vertex]
 
-        index = 0
-        for key in self.vertices.keys():
-            self.vertices[key] = index
-            index += 1
+        # move the last vertex into the removed vertex's row and column, then clear the last ones
+        index = self.vertices.pop(vertex)
+        last = self._n - 1
+        if index != last:
+            self._matrix[index, :self._n] = self._matrix[last, :self._n]
+            self._matrix[:self._n, index] = self._matrix[:self._n, last]
+            self._index_to_vertex[index] = self._index_to_vertex[last]
+            self.vertices[self._index_to_vertex[index]] = index
+        self._index_to_vertex.pop()
+
+        self._matrix[last, :self._n] = 0
+        self._matrix[:self._n, last] = 0
+        self._n = last
+        self._neighbor_indices.clear()
+        self._sorted_vertices = None
 
         return True
 
@@ -182,6 +229,33 @@ class AdjacencyMatrix:
 
         return weight
 
+    @staticmethod
+    def _encode_weights(weights):
+        """
+
+        Helper function. Maps a sequence of edge weights to their stored values, see update_weight()
+
+        """
+        unweighted = np.fromiter((weight is None for weight in weights), dtype=bool, count=len(weights))
+        encoded = np.fromiter((0 if weight is None else weight for weight in weights), dtype=np.int64,
+                              count=len(weights))
+        encoded = np.where(encoded >= 0, encoded + 2, encoded)
+        encoded[unweighted] = 1
+
+        return encoded
+
+    @staticmethod
+    def _decode_weights(weights):
+        """
+
+        Helper function. Maps an array of stored weights back to edge weights, the inverse of update_weight()
+
+        """
+        decoded = np.where(weights > 0, weights - 2, weights).astype(object)
+        decoded[weights == 1] = None
+
+        return decoded.tolist()
+
     def add_edge(self, vertex1, vertex2, weight=None):
         """
 
@@ -210,17 +284,82 @@ class AdjacencyMatrix:
         self.verify_vertex_present(vertex1)
         self.verify_vertex_present(vertex2)
 
-        if self.adjacency_matrix[self.vertices[vertex1], self.vertices[vertex2]] != 0:
+        # indices past _n are never used, so the whole buffer can be indexed without slicing a view
+        matrix = self._matrix
+        i, j = self.vertices[vertex1], self.vertices[vertex2]
+
+        if matrix[i, j] != 0:
             raise NeighborAlreadyExistsError(f"Neighbor: {vertex2}: already present for vertex: {vertex1}")
 
         weight = self.update_weight(weight)
 
-        self.adjacency_matrix[self.vertices[vertex1], self.vertices[vertex2]] = weight
+        matrix[i, j] = weight
+
+        if not self.directed and i != j and matrix[j, i] == 0:
+            matrix[j, i] = weight
+
+        self._neighbor_indices.pop(i, None)
+        self._neighbor_indices.pop(j, None)
+        return True
+
+    def add_edges(self, edges):
+        """
+
+        Parameters
+        ----------
+        edges : iterable
+            (vertex1, vertex2) or (vertex1, vertex2, weight) edges to add. Edges are only added
+            if all of them are valid
+
+        Raises
+        ------
+        VertexDoesNotExistError
+            if any of the given vertices do not exist
+        NeighborAlreadyExistsError
+            if any of the given edges already exists, or is given more than once
+
+        Returns
+        -------
+        bool
+            True on success
+
+        """
+        edges = [(edge[0], edge[1], edge[2] if len(edge) > 2 else None) for edge in edges]
+
+        missing = [vertex for vertex in dict.fromkeys(vertex for edge in edges for vertex in edge[:2])
+                   if vertex not in self.vertices]
+        if missing:
+            raise VertexDoesNotExistError(f"Vertices: {missing}: not present in graph")
+
+        rows = np.fromiter((self.vertices[edge[0]] for edge in edges), dtype=np.intp, count=len(edges))
+        cols = np.fromiter((self.vertices[edge[1]] for edge in edges), dtype=np.intp, count=len(edges))
+        weights = self._encode_weights([edge[2] for edge in edges])
 
-        if not self.directed and vertex1 != vertex2 and \
-                self.adjacency_matrix[self.vertices[vertex2], self.vertices[vertex1]] == 0:
-            self.adjacency_matrix[self.vertices[vertex2], self.vertices[vertex1]] = weight
+        # the stored weights are computed as int64, so check they fit the matrix dtype as add_edge() does
+        limits = np.iinfo(self._matrix.dtype)
+        overflow = np.flatnonzero((weights < limits.min) | (weights > limits.max))
+        if len(overflow):
+            raise OverflowError(f"Weight: {edges[overflow[0]][2]}: out of bounds for {self._matrix.dtype}")
 
+        # an undirected edge is the same edge in either direction
+        if self.directed:
+            keys = rows * self._n + cols
+        else:
+            keys = np.minimum(rows, cols) * self._n + np.maximum(rows, cols)
+        repeated = np.ones(len(edges), dtype=bool)
+        repeated[np.unique(keys, return_index=True)[1]] = False
+
+        invalid = np.flatnonzero((self.adjacency_matrix[rows, cols] != 0) | repeated)
+        if len(invalid):
+            vertex1, vertex2 = edges[invalid[0]][:2]
+            raise NeighborAlreadyExistsError(f"Neighbor: {vertex2}: already present for vertex: {vertex1}")
+
+        self._matrix[rows, cols] = weights
+        if not self.directed:
+            mirror = (rows != cols) & (self._matrix[cols, rows] == 0)
+            self._matrix[cols[mirror], rows[mirror]] = weights[mirror]
+
+        self._neighbor_indices.clear()
         return True
 
     def remove_edge(self, vertex1, vertex2, weight=None):
@@ -251,15 +390,19 @@ class AdjacencyMatrix:
         self.verify_vertex_present(vertex1)
         self.verify_vertex_present(vertex2)
 
-        if self.adjacency_matrix[self.vertices[vertex1], self.vertices[vertex2]] == 0:
+        matrix = self._matrix
+        i, j = self.vertices[vertex1], self.vertices[vertex2]
+
+        if matrix[i, j] == 0:
             raise NeighborDoesNotExistError(f"Neighbor: {vertex2}: not present for vertex: {vertex1}")
 
-        self.adjacency_matrix[self.vertices[vertex1], self.vertices[vertex2]] = 0
+        matrix[i, j] = 0
 
-        if not self.directed and vertex1 != vertex2 and \
-                self.adjacency_matrix[self.vertices[vertex2], self.vertices[vertex1]] != 0:
-            self.adjacency_matrix[self.vertices[vertex2], self.vertices[vertex1]] = 0
+        if not self.directed:
+            matrix[j, i] = 0
 
+        self._neighbor_indices.pop(i, None)
+        self._neighbor_indices.pop(j, None)
         return True
 
     def is_neighbor(self, vertex1, vertex2):
@@ -278,10 +421,30 @@ class AdjacencyMatrix:
             if vertex2 is a neighbor of vertex1
 
         """
-        if self.adjacency_matrix[self.vertices[vertex1], self.vertices[vertex2]] != 0:
-            return True
+        return bool(self._matrix[self.vertices[vertex1], self.vertices[vertex2]] != 0)
+
+    def degree(self, vertex):
+        """
+
+        Parameters
+        ----------
+        vertex : int, string, etc.
+            vertex to count the neighbors of
+
+        Raises
+        ------
+        VertexDoesNotExistError
+            if the given vertex does not exist (see verify_vertex_present())
+
+        Returns
+        -------
+        int
+            the number of neighbors of the given vertex
+
+        """
+        self.verify_vertex_present(vertex)
 
-        return False
+        return int(np.count_nonzero(self.adjacency_matrix[self.vertices[vertex]]))
 
     def empty(self):
         """
@@ -292,7 +455,7 @@ class AdjacencyMatrix:
             if this Adjacency Matrix is empty
 
         """
-        return len(self.vertices) == 0 and len(self.adjacency_matrix) == 0
+        return self._n == 0
 
     def set_directed(self, directed):
         """
@@ -333,22 +496,16 @@ class AdjacencyMatrix:
 
         Returns
         -------
-        dict
-            the transpose of the indices between self and other
+        tuple
+            the indices of the shared vertices in the source matrix, and their matching indices in the
+            target matrix
 
         """
-        transposed = {}
+        shared = self.vertices.keys() & other.vertices.keys()
+        source, target = (other, self) if direction else (self, other)
 
-        if direction:
-            for vertex in self.vertices:
-                if vertex in other.vertices:
-                    transposed[other.vertices[vertex]] = self.vertices[vertex]
-        else:
-            for vertex in other.vertices:
-                if vertex in self.vertices:
-                    transposed[self.vertices[vertex]] = other.vertices[vertex]
-
-        return transposed
+        return (np.fromiter((source.vertices[vertex] for vertex in shared), dtype=np.intp, count=len(shared)),
+                np.fromiter((target.vertices[vertex] for vertex in shared), dtype=np.intp, count=len(shared)))
 
     def union(self, other):
         """
@@ -372,30 +529,22 @@ class AdjacencyMatrix:
         if not isinstance(other, AdjacencyMatrix):
             raise AdjacencyMatrixOperationError("Adjacency Matrix union can only be performed on Adjacency Matrices")
 
-        transposed = self._transpose(other, True)
-
         for vertex in other.vertices:
             if vertex not in self.vertices:
                 self.add_vertex(vertex)
-            transposed[other.vertices[vertex]] = self.vertices[vertex]
-
-        for index, value in np.ndenumerate(other.adjacency_matrix):
-            if self.adjacency_matrix[transposed[index[0]], transposed[index[1]]] == 0 and value != 0:
-                self.adjacency_matrix[transposed[index[0]], transposed[index[1]]] = value
-            elif value != 0 and value != 1:
-                self.adjacency_matrix[transposed[index[0]], transposed[index[1]]] = \
-                    min(self.adjacency_matrix[transposed[index[0]], transposed[index[1]]], value)
-
-            if not self.directed and other.directed:
-                if self.adjacency_matrix[transposed[index[1]], transposed[index[0]]] == 0 and \
-                        other.adjacency_matrix[index[1], index[0]] != 0:
-                    self.adjacency_matrix[transposed[index[1]], transposed[index[0]]] = \
-                        other.adjacency_matrix[index[1], index[0]]
-                elif other.adjacency_matrix[index[1], index[0]] != 0 and \
-                        other.adjacency_matrix[index[1], index[0]] != 1:
-                    self.adjacency_matrix[transposed[index[1]], transposed[index[0]]] = \
-                        min(self.adjacency_matrix[transposed[index[1]], transposed[index[0]]],
-                            other.adjacency_matrix[index[1], index[0]])
+
+        self._promote_dtype(other)
+        source, target = self._transpose(other, True)
+
+        # missing edges are filled in from other, and weighted edges keep the smaller weight, while
+        # an unweighted edge in other never replaces an existing edge
+        values = other.adjacency_matrix[np.ix_(source, source)]
+        current = self.adjacency_matrix[np.ix_(target, target)]
+        merged = np.minimum(current, values)
+        np.copyto(merged, current, where=(values == 0) | (values == 1))
+        np.copyto(merged, values, where=current == 0)
+        self._matrix[np.ix_(target, target)] = merged
+        self._neighbor_indices.clear()
 
         return self
 
@@ -422,34 +571,21 @@ class AdjacencyMatrix:
             raise AdjacencyMatrixOperationError(
                 "Adjacency Matrix intersection can only be performed on Adjacency Matrices")
 
-        vertices_copy = deepcopy(self.vertices)
-        for vertex in vertices_copy.keys():
+        for vertex in tuple(self.vertices):
             if vertex not in other.vertices:
                 self.remove_vertex(vertex)
 
-        transposed = self._transpose(other, False)
-
-        for vertex in self.vertices:
-            if vertex not in other.vertices:
-                self.remove_vertex(vertex)
+        self._promote_dtype(other)
+        source, target = self._transpose(other, False)
 
-        for index, value in np.ndenumerate(self.adjacency_matrix):
-            if other.adjacency_matrix[transposed[index[0]], transposed[index[1]]] != 0 and value != 0:
-                if other.adjacency_matrix[transposed[index[0]], transposed[index[1]]] != 1:
-                    self.adjacency_matrix[index[0], index[1]] = \
-                        min(other.adjacency_matrix[transposed[index[0]], transposed[index[1]]], value)
-            else:
-                self.adjacency_matrix[index[0], index[1]] = 0
-
-            if not self.directed and other.directed:
-                if other.adjacency_matrix[transposed[index[1]], transposed[index[0]]] != 0 and \
-                        self.adjacency_matrix[index[1], index[0]] != 0:
-                    if other.adjacency_matrix[transposed[index[1]], transposed[index[0]]] != 1:
-                        self.adjacency_matrix[index[1], index[0]] = \
-                            min(other.adjacency_matrix[transposed[index[1]], transposed[index[0]]],
-                                self.adjacency_matrix[index[1], index[0]])
-                else:
-                    self.adjacency_matrix[index[1], index[0]] = 0
+        # only edges present in both are kept, with the smaller weight unless other's edge is unweighted
+        current = self.adjacency_matrix[np.ix_(source, source)]
+        values = other.adjacency_matrix[np.ix_(target, target)]
+        merged = np.minimum(current, values)
+        np.copyto(merged, current, where=values == 1)
+        merged[(values == 0) | (current == 0)] = 0
+        self._matrix[np.ix_(source, source)] = merged
+        self._neighbor_indices.clear()
 
         return self
 
@@ -476,13 +612,44 @@ class AdjacencyMatrix:
             raise AdjacencyMatrixOperationError(
                 "Adjacency Matrix difference can only be performed on Adjacency Matrices")
 
-        vertices_copy = deepcopy(self.vertices)
-        for vertex in vertices_copy.keys():
-            if vertex in other.vertices.keys():
+        for vertex in tuple(self.vertices):
+            if vertex in other.vertices:
                 self.remove_vertex(vertex)
 
         return self
 
+    def _promote_dtype(self, other):
+        """
+
+        Helper function. Widens this matrix's dtype so it can hold every weight stored in other
+
+        """
+        dtype = np.result_type(self._matrix, other._matrix)
+        if dtype != self._matrix.dtype:
+            self._matrix = self._matrix.astype(dtype)
+
+    def _join_edges(self, vertices, other_vertices):
+        """
+
+        Helper function. Adds an unweighted edge from each of vertices to each distinct vertex of
+        other_vertices, in both directions if undirected, wherever no edge exists yet
+
+        """
+        rows = np.fromiter((self.vertices[vertex] for vertex in vertices), dtype=np.intp, count=len(vertices))
+        cols = np.fromiter((self.vertices[vertex] for vertex in other_vertices), dtype=np.intp,
+                           count=len(other_vertices))
+
+        blocks = [(rows, cols)]
+        if not self.directed:
+            blocks.append((cols, rows))
+
+        for source, target in blocks:
+            block = self.adjacency_matrix[np.ix_(source, target)]
+            block[(block == 0) & (source[:, None] != target[None, :])] = self.update_weight(None)
+            self._matrix[np.ix_(source, target)] = block
+
+        self._neighbor_indices.clear()
+
     def __add__(self, other):
         """
 
@@ -506,42 +673,12 @@ class AdjacencyMatrix:
             raise AdjacencyMatrixOperationError(
                 "Adjacency Matrix join can only be performed on Adjacency Matrices")
 
-        transposed = self._transpose(other, True)
-
         adjacency_matrix = AdjacencyMatrix(self.directed)
-        adjacency_matrix.adjacency_matrix = deepcopy(self.adjacency_matrix)
-        adjacency_matrix.vertices = deepcopy(self.vertices)
-
-        for vertex in other.vertices:
-            if vertex not in self.vertices:
-                adjacency_matrix.add_vertex(vertex)
-            transposed[other.vertices[vertex]] = adjacency_matrix.vertices[vertex]
-
-        for index, value in np.ndenumerate(other.adjacency_matrix):
-            if adjacency_matrix.adjacency_matrix[transposed[index[0]], transposed[index[1]]] == 0 and value != 0:
-                adjacency_matrix.adjacency_matrix[transposed[index[0]], transposed[index[1]]] = value
-            elif value != 0 and value != 1:
-                adjacency_matrix.adjacency_matrix[transposed[index[0]], transposed[index[1]]] = \
-                    min(adjacency_matrix.adjacency_matrix[transposed[index[0]], transposed[index[1]]], value)
-
-            if not adjacency_matrix.directed and other.directed:
-                if adjacency_matrix.adjacency_matrix[transposed[index[1]], transposed[index[0]]] == 0 and \
-                        other.adjacency_matrix[index[1], index[0]] != 0:
-                    adjacency_matrix.adjacency_matrix[transposed[index[1]], transposed[index[0]]] = \
-                        other.adjacency_matrix[index[1], index[0]]
-                elif other.adjacency_matrix[index[1], index[0]] != 0 and \
-                        other.adjacency_matrix[index[1], index[0]] != 1:
-                    adjacency_matrix.adjacency_matrix[transposed[index[1]], transposed[index[0]]] = \
-                        min(adjacency_matrix.adjacency_matrix[transposed[index[1]], transposed[index[0]]],
-                            other.adjacency_matrix[index[1], index[0]])
-
-        for vertex in self.vertices:
-            for node in other.vertices:
-                if vertex != node:
-                    if not adjacency_matrix.is_neighbor(vertex, node):
-                        adjacency_matrix.add_edge(vertex, node)
-                    if not adjacency_matrix.directed and not adjacency_matrix.is_neighbor(node, vertex):
-                        adjacency_matrix.add_edge(node, vertex)
+        adjacency_matrix.adjacency_matrix = self.adjacency_matrix.copy()
+        adjacency_matrix.vertices = dict(self.vertices)
+        adjacency_matrix._index_to_vertex = list(self._index_to_vertex)
+        adjacency_matrix.union(other)
+        adjacency_matrix._join_edges(self.vertices, other.vertices)
 
         return adjacency_matrix
 
@@ -568,16 +705,9 @@ class AdjacencyMatrix:
             raise AdjacencyMatrixOperationError(
                 "Adjacency Matrix join can only be performed on Adjacency Matrices")
 
-        temp_copy = deepcopy(self.vertices)
+        vertices = tuple(self.vertices)
         self.union(other)
-
-        for vertex in temp_copy.keys():
-            for node in other.vertices:
-                if vertex != node:
-                    if not self.is_neighbor(vertex, node):
-                        self.add_edge(vertex, node)
-                    if not self.directed and not self.is_neighbor(node, vertex):
-                        self.add_edge(node, vertex)
+        self._join_edges(vertices, other.vertices)
 
         return self
 
@@ -605,8 +735,9 @@ class AdjacencyMatrix:
                 "Adjacency Matrix difference can only be performed on Adjacency Matrices")
 
         adjacency_matrix = AdjacencyMatrix(self.directed)
-        adjacency_matrix.vertices = deepcopy(self.vertices)
-        adjacency_matrix.adjacency_matrix = deepcopy(self.adjacency_matrix)
+        adjacency_matrix.vertices = dict(self.vertices)
+        adjacency_matrix._index_to_vertex = list(self._index_to_vertex)
+        adjacency_matrix.adjacency_matrix = self.adjacency_matrix.copy()
 
         for vertex in self.vertices.keys():
             if vertex in other.vertices.keys():
@@ -652,13 +783,14 @@ class AdjacencyMatrix:
         if not isinstance(other, AdjacencyMatrix):
             return False
 
-        if not (self.adjacency_matrix == other.adjacency_matrix).all():
+        if self.directed != other.directed or self._n != other._n or self.vertices.keys() != other.vertices.keys():
             return False
 
-        if self.directed != other.directed:
-            return False
+        # the same vertex can sit at different indices in each matrix
+        order = np.fromiter((other.vertices[vertex] for vertex in self._index_to_vertex), dtype=np.intp,
+                            count=self._n)
 
-        return True
+        return np.array_equal(self.adjacency_matrix, other.adjacency_matrix[np.ix_(order, order)])
 
     def __ne__(self, other):
         """
@@ -687,21 +819,23 @@ class AdjacencyMatrix:
         """
         out_string = self.name() + ":\n"
 
-        for vertex in sorted(self.vertices.keys()):
+        if self._sorted_vertices is None:
+            self._sorted_vertices = sorted(self.vertices.keys())
+
+        matrix = self.adjacency_matrix
+        vertices = self.vertices
+        index_to_vertex = self._index_to_vertex
+        decode_weights = self._decode_weights
+
+        for vertex in self._sorted_vertices:
             out_string += f"{vertex}: "
-            vertex_list = []
-            for i in range(len(self.adjacency_matrix[self.vertices[vertex]])):
-                if self.adjacency_matrix[self.vertices[vertex]][i] != 0:
-                    vertex2 = list(self.vertices.keys())[list(self.vertices.values()).index(i)]
-                    tgt_weight = self.adjacency_matrix[self.vertices[vertex], self.vertices[vertex2]]
-                    if tgt_weight == 1:
-                        tgt_weight = None
-                    else:
-                        tgt_weight = tgt_weight - 2 if tgt_weight > 0 else tgt_weight
-                    vertex_list.append([vertex2, tgt_weight])
+            row = matrix[vertices[vertex]]
+            targets = np.flatnonzero(row)
+            vertex_list = [[index_to_vertex[i], tgt_weight] for i, tgt_weight in
+                           zip(targets.tolist(), decode_weights(row[targets]))]
 
             out_string += \
-                f"{'No Neighbors' if len(vertex_list) == 0 else sorted(vertex_list, key = lambda x : (x[0], x[1]))}\n"
+                f"{'No Neighbors' if len(vertex_list) == 0 else sorted(vertex_list, key=itemgetter(0, 1))}\n"
 
         if self.empty():
             out_string += "Empty Adjacency Matrix\n"
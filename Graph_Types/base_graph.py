@@ -8,9 +8,12 @@ from copy import deepcopy
 
 
 class BaseGraph:
+
+    # derived graph types that store neighbors set this to True
+    _supports_edges = False
     
     def __init__(self):
-        self.vertices = set()
+        self.vertices = {}
         self.directed = False
         self.multiple_edges = False
         self.default_weight = 0
@@ -24,7 +27,7 @@ class BaseGraph:
             a random vertex from this graph
 
         """
-        return min(self.vertices, key=lambda vertex: vertex.value)
+        return self.vertices[min(self.vertices)]
 
     def verify_vertex_present(self, vertex):
         """
@@ -40,7 +43,7 @@ class BaseGraph:
             if the given vertex does not exist
 
         """
-        if BaseGraphNode(vertex) not in self.vertices:
+        if vertex not in self.vertices:
             raise VertexDoesNotExistError(f"Vertex: {vertex}: not present in graph")
 
     def verify_vertex_not_present(self, vertex):
@@ -57,7 +60,7 @@ class BaseGraph:
             if the given vertex does exist
 
         """
-        if BaseGraphNode(vertex) in self.vertices:
+        if vertex in self.vertices:
             raise VertexAlreadyExistsError(f"Vertex: {vertex}: already present in graph")
     
     def get_vertex(self, vertex):
@@ -75,14 +78,35 @@ class BaseGraph:
 
         """
         self.verify_vertex_present(vertex)
-        
-        for node in self.vertices:
-            if node == BaseGraphNode(vertex):
-                return node
-        
-        # Unreachable
-        return None
+
+        return self.vertices[vertex]
     
+    def _lookup(self, vertex):
+        """
+        Helper function. Finds the node for the given vertex with a single dict lookup.
+
+        Parameters
+        ----------
+        vertex : int, string, etc.
+            vertex to find
+
+        Raises
+        ------
+        VertexDoesNotExistError
+            if the given vertex does not exist
+
+        Returns
+        -------
+        BaseGraphNode
+            the node stored for the vertex
+
+        """
+        node = self.vertices.get(vertex)
+        if node is None:
+            raise VertexDoesNotExistError(f"Vertex: {vertex}: not present in graph")
+
+        return node
+
     def add_vertex(self, vertex):
         """
         
@@ -104,7 +128,7 @@ class BaseGraph:
         """
                 
         self.verify_vertex_not_present(vertex)
-        self.vertices.add(BaseGraphNode(vertex))
+        self.vertices[vertex] = BaseGraphNode(vertex)
         
         return True
 
@@ -128,7 +152,7 @@ class BaseGraph:
 
         """
         self.verify_vertex_present(vertex)
-        self.vertices.discard(BaseGraphNode(vertex))
+        del self.vertices[vertex]
         
         return True
           
@@ -157,32 +181,140 @@ class BaseGraph:
             true on successful add
 
         """
-        if type(self) == BaseGraph:
+        if not self._supports_edges:
             raise GraphOperationError("Base Graphs do not support edges")
         
-        self.verify_vertex_present(vertex1)
-        self.verify_vertex_present(vertex2)
-
-        new_node = self.get_vertex(vertex1)
-        self.vertices.discard(new_node)
+        new_node = self._lookup(vertex1)
+        vertex2_node = self._lookup(vertex2)
         
         if not self.directed and vertex1 != vertex2:
-            vertex2_node = self.get_vertex(vertex2)
-            self.vertices.discard(vertex2_node)
-
             if weight is not None:
                 vertex2_node.insert_neighbor(new_node.value, weight)
             else:
                 vertex2_node.insert_neighbor(new_node.value)
-            self.vertices.add(vertex2_node)
         
         if weight is not None:
             new_node.insert_neighbor(vertex2, weight)
         else:
             new_node.insert_neighbor(vertex2)
-        self.vertices.add(new_node)
         
         return True
+
+    def _edge_list(self, edges):
+        """
+        Helper function. Normalizes the given edges to (vertex1, vertex2, weight) tuples, checking
+        every vertex they use once.
+
+        Parameters
+        ----------
+        edges : iterable
+            (vertex1, vertex2) or (vertex1, vertex2, weight) edges
+
+        Raises
+        ------
+        GraphOperationError
+            if self is a BaseGraph
+        VertexDoesNotExistError
+            if any of the given vertices do not exist
+
+        Returns
+        -------
+        list of tuples
+
+        """
+        if not self._supports_edges:
+            raise GraphOperationError("Base Graphs do not support edges")
+
+        edges = [(edge[0], edge[1], edge[2] if len(edge) > 2 else None) for edge in edges]
+
+        missing = [vertex for vertex in dict.fromkeys(vertex for edge in edges for vertex in edge[:2])
+                   if vertex not in self.vertices]
+        if missing:
+            raise VertexDoesNotExistError(f"Vertices: {missing}: not present in graph")
+
+        return edges
+
+    def add_edges(self, edges):
+        """
+
+        Parameters
+        ----------
+        edges : iterable
+            (vertex1, vertex2) or (vertex1, vertex2, weight) edges to add. Edges are only added
+            if all of them are valid
+
+        Raises
+        ------
+        GraphOperationError
+            if self is a BaseGraph
+        VertexDoesNotExistError
+            if any of the given vertices do not exist
+        NeighborAlreadyExistsError
+            if any of the given edges already exists, or is given more than once
+
+        Returns
+        -------
+        bool
+            True on success
+
+        """
+        edges = self._edge_list(edges)
+        nodes = self.vertices
+
+        if not self.multiple_edges:
+            pending = set()
+            for vertex1, vertex2, weight in edges:
+                if nodes[vertex1].is_neighbor(vertex2) or (vertex1, vertex2) in pending or \
+                        (not self.directed and nodes[vertex2].is_neighbor(vertex1)):
+                    raise NeighborAlreadyExistsError(f"Neighbor: {vertex2}: "
+                                                     f"already present for vertex: {vertex1}")
+                pending.add((vertex1, vertex2))
+                if not self.directed:
+                    pending.add((vertex2, vertex1))
+
+        for vertex1, vertex2, weight in edges:
+            weights = () if weight is None else (weight,)
+            if not self.directed and vertex1 != vertex2:
+                nodes[vertex2].insert_neighbor(vertex1, *weights)
+
+            nodes[vertex1].insert_neighbor(vertex2, *weights)
+
+        return True
+
+    def remove_edges(self, edges):
+        """
+
+        Parameters
+        ----------
+        edges : iterable
+            (vertex1, vertex2) or (vertex1, vertex2, weight) edges to remove, in order
+
+        Raises
+        ------
+        GraphOperationError
+            if self is a BaseGraph
+        VertexDoesNotExistError
+            if any of the given vertices do not exist
+        NeighborDoesNotExistError
+            if one of the given edges does not exist when it is reached
+
+        Returns
+        -------
+        bool
+            True on success
+
+        """
+        edges = self._edge_list(edges)
+        nodes = self.vertices
+
+        for vertex1, vertex2, weight in edges:
+            weights = () if weight is None else (weight,)
+            if not self.directed and vertex1 != vertex2:
+                nodes[vertex2].remove_neighbor(vertex1, *weights)
+
+            nodes[vertex1].remove_neighbor(vertex2, *weights)
+
+        return True
     
     def remove_edge(self, vertex1, vertex2, weight=None):
         """
@@ -209,29 +341,22 @@ class BaseGraph:
             True on success
 
         """
-        if type(self) == BaseGraph:
+        if not self._supports_edges:
             raise GraphOperationError("Base Graphs do not support edges")
             
-        self.verify_vertex_present(vertex1)
-        self.verify_vertex_present(vertex2)
-        
-        new_node = self.get_vertex(vertex1)
-        self.vertices.discard(new_node)
+        new_node = self._lookup(vertex1)
+        vertex2_node = self._lookup(vertex2)
         
         if not self.directed and vertex1 != vertex2:
-            vertex2_node = self.get_vertex(vertex2)
-            self.vertices.discard(vertex2_node)
             if weight is not None:
                 vertex2_node.remove_neighbor(new_node.value, weight)
             else:
                 vertex2_node.remove_neighbor(new_node.value)
-            self.vertices.add(vertex2_node)
 
         if weight is not None:
             new_node.remove_neighbor(vertex2, weight)
         else:
             new_node.remove_neighbor(vertex2)
-        self.vertices.add(new_node)
         
         return True
 
@@ -256,22 +381,20 @@ class BaseGraph:
         """
         if not isinstance(other, BaseGraph):
             raise GraphOperationError("Graph union can only be performed on graphs of same type")
-        elif type(self) == BaseGraph:
-            self.vertices = self.vertices.union(other.vertices)
+        elif not self._supports_edges:
+            for value, vertex in other.vertices.items():
+                self.vertices.setdefault(value, vertex)
         else:
-            for vertex in other.vertices:
-                if vertex not in self.vertices:
+            for value, vertex in other.vertices.items():
+                if value not in self.vertices:
                     new_vertex = vertex
                     if other.multiple_edges != self.multiple_edges:
                         new_vertex = deepcopy(vertex)
                         new_vertex.update_multiple_edges(self.multiple_edges)
                     
-                    self.vertices.add(new_vertex)
+                    self.vertices[value] = new_vertex
                 else:
-                    node = self.get_vertex(vertex.value)
-                    self.vertices.discard(node)
-                    node += vertex
-                    self.vertices.add(node)
+                    self.vertices[value].union(vertex)
         
         return self
     
@@ -296,20 +419,14 @@ class BaseGraph:
         """
         if not isinstance(other, BaseGraph):
             raise GraphOperationError("Graph intersection can only be performed on graphs of same type")
-        elif type(self) == BaseGraph:
-            self.vertices = self.vertices.intersection(other.vertices)
+        elif not self._supports_edges:
+            self.vertices = {value: vertex for value, vertex in self.vertices.items() if value in other.vertices}
         else:            
-            vertices_copy = deepcopy(self.vertices)
-            
-            for vertex in vertices_copy:
-                if vertex not in other.vertices:
-                    self.vertices.discard(vertex)
+            for value in self.vertices.keys() - other.vertices.keys():
+                del self.vertices[value]
                 
-            for vertex in self.vertices:
-                for node in other.vertices:
-                    if vertex == node:
-                        vertex.intersection(node)
-                        break
+            for value, vertex in self.vertices.items():
+                vertex.intersection(other.vertices[value])
         
         return self
     
@@ -334,19 +451,16 @@ class BaseGraph:
         """
         if not isinstance(other, BaseGraph):
             raise GraphOperationError("Graph difference can only be performed on graphs of same type")
-        elif type(self) == BaseGraph:
-            self.vertices = self.vertices.difference(other.vertices)
+        elif not self._supports_edges:
+            self.vertices = {value: vertex for value, vertex in self.vertices.items() if value not in other.vertices}
         else:                 
-            vertices_copy = deepcopy(self.vertices)
-            
-            for vertex in vertices_copy:
-                if vertex in other.vertices:
-                    self.vertices.discard(vertex)
+            for value in self.vertices.keys() & other.vertices.keys():
+                del self.vertices[value]
             # remove phantom edges
-            for vertex in self.vertices:
-                for vertex2 in other.vertices:
-                    while vertex.is_neighbor(vertex2.value):
-                        vertex.remove_neighbor(vertex2.value)
+            for vertex in self.vertices.values():
+                for value in other.vertices.keys() & vertex.neighbors:
+                    while vertex.is_neighbor(value):
+                        vertex.remove_neighbor(value)
 
         return self
     
@@ -372,7 +486,7 @@ class BaseGraph:
         """
         return "Base Graph"
     
-    def join(self, other, default_weight=None):
+    def join(self, other, default_weight=None, inplace=False):
         """
         
         Parameters
@@ -381,6 +495,8 @@ class BaseGraph:
             the other graph's vertices to join this one's with
         default_weight : int, optional
             the weight to use for joined edges in Weighted Graphs. Leave blank for Unweighted Graphs.
+        inplace : bool, optional
+            join into this graph's own vertices instead of a copy of them. The default is False
 
         Raises
         ------
@@ -389,17 +505,17 @@ class BaseGraph:
 
         Returns
         -------
-        set of vertices
+        dict of vertices
 
         """
-        if type(self) == BaseGraph:
+        if not self._supports_edges:
             raise GraphOperationError("Graph join function not supported for Base Graphs")
             
-        vertices_copy = deepcopy(self.vertices)
+        vertices_copy = self.vertices if inplace else deepcopy(self.vertices)
         other_copy = deepcopy(other.vertices)
         
-        for vertex in vertices_copy:
-            for node in other_copy:
+        for vertex in vertices_copy.values():
+            for node in other_copy.values():
                 if vertex != node:
                     if not vertex.is_neighbor(node.value):
                         if default_weight is not None:
@@ -414,14 +530,13 @@ class BaseGraph:
                 else:
                     vertex.union(node)
         
-        for vertex in other_copy:
-            if vertex not in vertices_copy:
-                new_vertex = vertex
+        # other_copy is private to this call, so its nodes can be moved over without another copy
+        for value, vertex in other_copy.items():
+            if value not in vertices_copy:
                 if other.multiple_edges != self.multiple_edges:
-                    new_vertex = deepcopy(vertex)
-                    new_vertex.update_multiple_edges(self.multiple_edges)
+                    vertex.update_multiple_edges(self.multiple_edges)
                     
-                vertices_copy.add(new_vertex)
+                vertices_copy[value] = vertex
         
         return vertices_copy
     
@@ -448,8 +563,8 @@ class BaseGraph:
             raise GraphOperationError("Graph join can only be performed on graphs of same type")
             
         graph = BaseGraph()
-        graph.vertices = self.vertices.union(other.vertices)
-        return graph
+        graph.vertices = dict(self.vertices)
+        return graph.union(other)
     
     def __iadd__(self, other):
         """
@@ -496,22 +611,18 @@ class BaseGraph:
         """
         if not isinstance(other, BaseGraph):
             raise GraphOperationError("Graph difference can only be performed on graphs of same type")
-        elif type(self) == BaseGraph:
+        elif not self._supports_edges:
             graph = BaseGraph()
-            graph.vertices = self.vertices.difference(other.vertices)
+            graph.vertices = {value: vertex for value, vertex in self.vertices.items() if value not in other.vertices}
             return graph
         else:
-            vertices_copy = deepcopy(self.vertices)
-
-            for vertex in self.vertices:
-                if vertex in other.vertices:
-                    vertices_copy.discard(vertex)
+            # only the vertices that survive the difference are copied
+            vertices_copy = {value: deepcopy(vertex) for value, vertex in self.vertices.items()
+                             if value not in other.vertices}
                 
-            for vertex in vertices_copy:
-                for node in other.vertices:
-                    if vertex == node:
-                        vertex.difference(node)
-                        break
+            for value, vertex in vertices_copy.items():
+                if value in other.vertices:
+                    vertex.difference(other.vertices[value])
             
             return vertices_copy
     
@@ -556,14 +667,7 @@ class BaseGraph:
         if not isinstance(other, BaseGraph):
             return False
         
-        if len(self.vertices) != len(other.vertices):
-            return False
-        
-        for vertex in self.vertices:
-            if vertex not in other.vertices:
-                return False
-
-        return True
+        return self.vertices.keys() == other.vertices.keys()
     
     def __ne__(self, other):
         """
@@ -590,11 +694,7 @@ class BaseGraph:
             this BaseGraph as a string
 
         """
-        graph_string = self.name() + ":\n"
-        for vertex in self.vertices:
-            graph_string += vertex.__str__()
-        
         if self.empty():
-            graph_string = "Empty Base Graph"
-        
-        return graph_string
+            return "Empty Base Graph"
+
+        return "".join([self.name(), ":\n", *(vertex.__str__() for vertex in self.vertices.values())])
@@ -3,9 +3,13 @@
 """
 
 class BaseGraphNode:
+
+    __slots__ = ("value", "_hash")
     
     def __init__(self, value):
         self.value = value
+        # value identifies the node and never changes, so its hash is computed once
+        self._hash = hash(value)
 
     def __eq__(self, other):
         """
@@ -54,7 +58,7 @@ class BaseGraphNode:
             hash for this Graph Node object used for comparison
 
         """
-        return hash(self.value)
+        return self._hash
     
     def __str__(self):
         """
@@ -8,72 +8,22 @@ from .base_graph import BaseGraph
 from .unweighted_graph_node import UnweightedGraphNode
 from .graph_exceptions import *
 
+_NAMES = {(True, True): "Unweighted Directed Multi-graph",
+          (True, False): "Unweighted Directed Graph",
+          (False, True): "Unweighted Undirected Multi-graph",
+          (False, False): "Unweighted Undirected Graph"}
+
 
 class UnweightedGraph(BaseGraph):
+
+    _supports_edges = True
     
     def __init__(self, directed=True, multiple_edges=False):
         super().__init__()
-        self.vertices = set()
+        self.vertices = {}
         self.directed = directed
         self.multiple_edges = multiple_edges
 
-    def verify_vertex_present(self, vertex):
-        """
-
-        Parameters
-        ----------
-        vertex : int, string, etc.
-            vertex to verify is present in this UnweightedGraph
-
-        Raises
-        ------
-        VertexDoesNotExistError
-            if the given vertex does not exist
-
-        """
-        if UnweightedGraphNode(vertex) not in self.vertices:
-            raise VertexDoesNotExistError(f"Vertex: {vertex}: not present in graph")
-
-    def verify_vertex_not_present(self, vertex):
-        """
-
-        Parameters
-        ----------
-        vertex : int, string, etc.
-            vertex to verify is not present in this UnweightedGraph
-
-        Raises
-        ------
-        VertexAlreadyExistsError
-            if the given vertex does exist
-
-        """
-        if UnweightedGraphNode(vertex) in self.vertices:
-            raise VertexAlreadyExistsError(f"Vertex: {vertex}: already present in graph")
-    
-    def get_vertex(self, vertex):
-        """
-
-        Parameters
-        ----------
-        vertex : int, string, etc.
-            vertex to find
-
-        Raises
-        ------
-        VertexDoesNotExistError
-            if the given vertex does not exist (see verify_vertex_present())
-
-        """
-        self.verify_vertex_present(vertex)
-        
-        for node in self.vertices:
-            if node == UnweightedGraphNode(vertex):
-                return node
-        
-        # Unreachable
-        return None
-    
     def add_vertex(self, vertex):
         """
         
@@ -94,7 +44,7 @@ class UnweightedGraph(BaseGraph):
 
         """
         self.verify_vertex_not_present(vertex)
-        self.vertices.add(UnweightedGraphNode(vertex, self.multiple_edges))
+        self.vertices[vertex] = UnweightedGraphNode(vertex, self.multiple_edges)
         
         return True
     
@@ -118,9 +68,9 @@ class UnweightedGraph(BaseGraph):
 
         """
         self.verify_vertex_present(vertex)
-        self.vertices.discard(UnweightedGraphNode(vertex))
+        del self.vertices[vertex]
 
-        for key in self.vertices:
+        for key in self.vertices.values():
             while key.is_neighbor(vertex):
                 key.remove_neighbor(vertex)
 
@@ -151,6 +101,23 @@ class UnweightedGraph(BaseGraph):
 
         """
         return super().add_edge(vertex1, vertex2)
+
+    def add_edges(self, edges):
+        """
+        See BaseGraph.add_edges() for more details
+
+        Parameters
+        ----------
+        edges : iterable
+            (vertex1, vertex2) edges to add, any weights are ignored for UnweightedGraphs
+
+        Returns
+        -------
+        bool
+            if the new edges were added successfully
+
+        """
+        return super().add_edges((edge[0], edge[1]) for edge in edges)
         
     def remove_edge(self, vertex1, vertex2, weight=None):
         """
@@ -177,6 +144,23 @@ class UnweightedGraph(BaseGraph):
         
         """
         return super().remove_edge(vertex1, vertex2)
+
+    def remove_edges(self, edges):
+        """
+        See BaseGraph.remove_edges() for more details
+
+        Parameters
+        ----------
+        edges : iterable
+            (vertex1, vertex2) edges to remove, any weights are ignored for UnweightedGraphs
+
+        Returns
+        -------
+        bool
+            if the edges were removed successfully
+
+        """
+        return super().remove_edges((edge[0], edge[1]) for edge in edges)
     
     def union(self, other):
         """
@@ -273,11 +257,7 @@ class UnweightedGraph(BaseGraph):
             UnweightedGraph string name
 
         """
-        name_string = "Unweighted "
-        name_string += "Directed " if self.directed else "Undirected "
-        name_string += "Multi-graph" if self.multiple_edges else "Graph"
-        
-        return name_string
+        return _NAMES[(bool(self.directed), bool(self.multiple_edges))]
     
     def __add__(self, other):
         """
@@ -332,7 +312,7 @@ class UnweightedGraph(BaseGraph):
         if not isinstance(other, UnweightedGraph):
             raise GraphOperationError("Graph join can only be performed on graphs of same type")
             
-        self.vertices = super().join(other)
+        self.vertices = super().join(other, inplace=True)
         return self
     
     def __sub__(self, other):
@@ -408,14 +388,7 @@ class UnweightedGraph(BaseGraph):
         if self.directed != other.directed:
             return False
         
-        if len(self.vertices) != len(other.vertices):
-            return False
-        
-        for vertex in self.vertices:
-            if vertex not in other.vertices:
-                return False                
-
-        return True
+        return self.vertices.keys() == other.vertices.keys()
     
     def __ne__(self, other):
         """
@@ -442,11 +415,7 @@ class UnweightedGraph(BaseGraph):
             this UnweightedGraph as a string
 
         """
-        graph_string = self.name() + ":\n"
-        for vertex in sorted(self.vertices, key=lambda x: x.value):
-            graph_string += vertex.__str__()
-        
         if self.empty():
-            graph_string = "Empty Graph\n"
-        
-        return graph_string
+            return "Empty Graph\n"
+
+        return "".join([self.name(), ":\n", *(self.vertices[vertex].__str__() for vertex in sorted(self.vertices))])
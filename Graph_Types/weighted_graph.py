@@ -8,73 +8,23 @@ from .base_graph import BaseGraph
 from .weighted_graph_node import WeightedGraphNode
 from .graph_exceptions import *
 
+_NAMES = {(True, True): "Weighted Directed Multi-graph",
+          (True, False): "Weighted Directed Graph",
+          (False, True): "Weighted Undirected Multi-graph",
+          (False, False): "Weighted Undirected Graph"}
+
 
 class WeightedGraph(BaseGraph):
+
+    _supports_edges = True
     
     def __init__(self, directed=True, multiple_edges=False, default_weight=0):
         super().__init__()
-        self.vertices = set()
+        self.vertices = {}
         self.directed = directed
         self.default_weight = default_weight
         self.multiple_edges = multiple_edges
         
-    def verify_vertex_present(self, vertex):
-        """
-
-        Parameters
-        ----------
-        vertex : int, string, etc.
-            vertex to verify is present in this WeightedGraph
-
-        Raises
-        ------
-        VertexDoesNotExistError
-            if the given vertex does not exist
-
-        """
-        if WeightedGraphNode(vertex) not in self.vertices:
-            raise VertexDoesNotExistError(f"Vertex: {vertex}: not present in graph")
-
-    def verify_vertex_not_present(self, vertex):
-        """
-
-        Parameters
-        ----------
-        vertex : int, string, etc.
-            vertex to verify is not present in this WeightedGraph
-
-        Raises
-        ------
-        VertexAlreadyExistsError
-            if the given vertex does exist
-
-        """
-        if WeightedGraphNode(vertex) in self.vertices:
-            raise VertexAlreadyExistsError(f"Vertex: {vertex}: already present in graph")
-    
-    def get_vertex(self, vertex):
-        """
-
-        Parameters
-        ----------
-        vertex : int, string, etc.
-            vertex to find
-
-        Raises
-        ------
-        VertexDoesNotExistError
-            if the given vertex does not exist (see verify_vertex_present())
-
-        """
-        self.verify_vertex_present(vertex)
-        
-        for node in self.vertices:
-            if node == WeightedGraphNode(vertex):
-                return node
-        
-        # Unreachable
-        return None
-    
     def add_vertex(self, vertex):
         """
         
@@ -95,7 +45,7 @@ class WeightedGraph(BaseGraph):
 
         """
         self.verify_vertex_not_present(vertex)
-        self.vertices.add(WeightedGraphNode(vertex, self.multiple_edges))
+        self.vertices[vertex] = WeightedGraphNode(vertex, self.multiple_edges)
         
         return True
     
@@ -119,9 +69,9 @@ class WeightedGraph(BaseGraph):
 
         """
         self.verify_vertex_present(vertex)
-        self.vertices.discard(WeightedGraphNode(vertex))
+        del self.vertices[vertex]
 
-        for key in self.vertices:
+        for key in self.vertices.values():
             while key.is_neighbor(vertex):
                 key.remove_neighbor(vertex)
         
@@ -156,6 +106,25 @@ class WeightedGraph(BaseGraph):
         
         return super().add_edge(vertex1, vertex2, weight)
 
+    def add_edges(self, edges):
+        """
+        See BaseGraph.add_edges() for more details
+
+        Parameters
+        ----------
+        edges : iterable
+            (vertex1, vertex2) or (vertex1, vertex2, weight) edges to add, edges without a weight
+            use the default weight
+
+        Returns
+        -------
+        bool
+            if the new edges were added successfully
+
+        """
+        return super().add_edges((edge[0], edge[1], self.default_weight if len(edge) < 3 or edge[2] is None
+                                  else edge[2]) for edge in edges)
+
     def remove_edge(self, vertex1, vertex2, weight=None):
         """
         See BaseGraph.remove_edge() for more details
@@ -272,11 +241,7 @@ class WeightedGraph(BaseGraph):
             WeightedGraph string name
 
         """
-        name_string = "Weighted "
-        name_string += "Directed " if self.directed else "Undirected "
-        name_string += "Multi-graph" if self.multiple_edges else "Graph"
-        
-        return name_string
+        return _NAMES[(bool(self.directed), bool(self.multiple_edges))]
     
     def __add__(self, other):
         """
@@ -332,7 +297,7 @@ class WeightedGraph(BaseGraph):
         if not isinstance(other, WeightedGraph):
             raise GraphOperationError("Graph join can only be performed on graphs of same type")
 
-        self.vertices = super().join(other, self.default_weight)
+        self.vertices = super().join(other, self.default_weight, inplace=True)
         return self
 
     def __sub__(self, other):
@@ -409,14 +374,7 @@ class WeightedGraph(BaseGraph):
         if self.directed != other.directed:
             return False
         
-        if len(self.vertices) != len(other.vertices):
-            return False
-        
-        for vertex in self.vertices:
-            if vertex not in other.vertices:
-                return False
-
-        return True
+        return self.vertices.keys() == other.vertices.keys()
     
     def __ne__(self, other):
         """
@@ -443,11 +401,7 @@ class WeightedGraph(BaseGraph):
             this WeightedGraph as a string
 
         """
-        graph_string = self.name() + ":\n"
-        for vertex in sorted(self.vertices, key=lambda x: x.value):
-            graph_string += vertex.__str__()
-        
         if self.empty():
-            graph_string = "Empty Graph\n"
-        
-        return graph_string
+            return "Empty Graph\n"
+
+        return "".join([self.name(), ":\n", *(self.vertices[vertex].__str__() for vertex in sorted(self.vertices))])
@@ -10,6 +10,8 @@ from .graph_exceptions import VertexOperationError
 
 
 class WeightedGraphNode(BaseGraphNode):
+
+    __slots__ = ("multiple_edges", "neighbors")
     
     def __init__(self, value, multiple_edges=False):
         super().__init__(value)
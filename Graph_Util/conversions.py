@@ -17,10 +17,10 @@ class Conversions:
 
         new_graph = UnweightedGraph(True, weighted_graph.multiple_edges)
 
-        for vertex in weighted_graph.vertices:
+        for vertex in weighted_graph.vertices.values():
             new_graph.add_vertex(vertex.value)
 
-        for vertex in weighted_graph.vertices:
+        for vertex in weighted_graph.vertices.values():
             neighbors = vertex.get_neighbors()
 
             for neighbor in neighbors:
@@ -40,10 +40,10 @@ class Conversions:
 
         new_graph = WeightedGraph(True, unweighted_graph.multiple_edges, default_weight)
 
-        for vertex in unweighted_graph.vertices:
+        for vertex in unweighted_graph.vertices.values():
             new_graph.add_vertex(vertex.value)
 
-        for vertex in unweighted_graph.vertices:
+        for vertex in unweighted_graph.vertices.values():
             neighbors = vertex.get_neighbors()
 
             for neighbor in neighbors:
@@ -63,10 +63,10 @@ class Conversions:
 
         new_matrix = AdjacencyMatrix(True)
 
-        for vertex in graph.vertices:
+        for vertex in graph.vertices.values():
             new_matrix.add_vertex(vertex.value)
 
-        for vertex in graph.vertices:
+        for vertex in graph.vertices.values():
             neighbors = vertex.get_neighbors()
 
             for neighbor in neighbors:
@@ -86,10 +86,10 @@ class Conversions:
 
         new_list = AdjacencyList(True, graph.multiple_edges)
 
-        for vertex in graph.vertices:
+        for vertex in graph.vertices.values():
             new_list.add_vertex(vertex.value)
 
-        for vertex in graph.vertices:
+        for vertex in graph.vertices.values():
             neighbors = vertex.get_neighbors()
 
             for neighbor in neighbors:
@@ -219,8 +219,8 @@ class Conversions:
                         new_matrix.add_edge(vertex, neighbor[0], neighbor[1])
                     elif new_matrix.adjacency_matrix[new_matrix.vertices[vertex], new_matrix.vertices[neighbor[0]]] > \
                             new_matrix.update_weight(neighbor[1]):
-                        new_matrix.adjacency_matrix[new_matrix.vertices[vertex], new_matrix.vertices[neighbor[0]]] = \
-                            new_matrix.update_weight(neighbor[1])
+                        new_matrix.remove_edge(vertex, neighbor[0])
+                        new_matrix.add_edge(vertex, neighbor[0], neighbor[1])
 
         new_matrix.set_directed(adjacency_list.directed)
         return new_matrix
@@ -253,10 +253,10 @@ class Conversions:
         if isinstance(original, UnweightedGraph):
             new_graph = UnweightedGraph(True, original.multiple_edges)
 
-            for vertex in original.vertices:
+            for vertex in original.vertices.values():
                 new_graph.add_vertex(vertex.value)
 
-            for vertex in original.vertices:
+            for vertex in original.vertices.values():
                 neighbors = vertex.get_neighbors()
 
                 for neighbor in neighbors:
@@ -275,10 +275,10 @@ class Conversions:
         elif isinstance(original, WeightedGraph):
             new_graph = WeightedGraph(True, original.multiple_edges)
 
-            for vertex in original.vertices:
+            for vertex in original.vertices.values():
                 new_graph.add_vertex(vertex.value)
 
-            for vertex in original.vertices:
+            for vertex in original.vertices.values():
                 neighbors = vertex.get_neighbors()
 
                 for neighbor in neighbors: